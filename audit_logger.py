@@ -24,13 +24,23 @@ Log Format (one JSON object per line — JSONL):
 
 import os
 import sys
+import time
 import json
+import mmap
 import uuid
-import logging
+import queue
+import atexit
+import weakref
+import threading
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -38,6 +48,16 @@ VAULT_DIR = Path("d:/hackathon0/hackathon/AI_Employee_Vault")
 LOGS_DIR = VAULT_DIR / "Logs"
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Raw append-only fd flags (O_BINARY matters on Windows, O_CLOEXEC on POSIX)
+_OPEN_FLAGS = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+               | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+
+# fdatasync (Linux/POSIX) skips flushing inode metadata such as mtime; the
+# file size it still syncs is all an append-only log needs. Windows has
+# only fsync.
+_datasync = getattr(os, "fdatasync", os.fsync)
+TAIL_CHUNK_SIZE = 64 * 1024     # bytes read per backward step in tail_logs
+
 # Error categories
 class ErrorCategory:
     TRANSIENT = "TRANSIENT"  # Network timeouts, API rate limits, temp failures
@@ -56,9 +76,253 @@ class LogLevel:
     AUDIT = "AUDIT"     # Special level for audit trail entries
 
 
+# Severity order used for min_level gating (AUDIT sits between INFO and WARN)
+_LEVEL_ORD = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.AUDIT: 25,
+    LogLevel.WARN: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.CRITICAL: 50,
+}
+
+
 # ---------------------------------------------------------------------------
 # Audit Logger
 # ---------------------------------------------------------------------------
+# Weak registry so cached file handles are closed at exit without keeping
+# short-lived loggers (e.g. one per @retry call) alive forever.
+_LIVE_LOGGERS = weakref.WeakSet()
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+
+    def _dumps_line(obj):
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS)
+
+    def _dumps_value(obj):
+        return orjson.dumps(obj, default=str)
+else:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+    def _dumps_line(obj):
+        return (json.dumps(obj, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def _dumps_value(obj):
+        return json.dumps(obj, default=str).encode("utf-8")
+
+# Pre-encoded fragments for the info()/debug() fast path
+_LEVEL_FRAGMENT = {
+    lvl: b',"level":"' + lvl.encode("ascii") + b'","event":'
+    for lvl in (LogLevel.DEBUG, LogLevel.INFO)
+}
+_EVENT_BYTES = {ev: _dumps_value(ev) for ev in ("debug", "info", "warning", "general")}
+
+# Formatted timestamp cached per wall-clock millisecond. Stored as a single
+# tuple so readers never see a half-updated (ms, text) pair.
+_TS_CACHE = (0, "")
+
+
+def _ts_now():
+    """Local ISO-8601 timestamp with millisecond precision."""
+    global _TS_CACHE
+    ms = time.time_ns() // 1_000_000
+    cached_ms, text = _TS_CACHE
+    if ms == cached_ms:
+        return text
+    text = datetime.fromtimestamp(ms // 1000).replace(
+        microsecond=(ms % 1000) * 1000
+    ).isoformat(timespec="milliseconds")
+    _TS_CACHE = (ms, text)
+    return text
+
+
+# Background writer: producers enqueue serialized lines, a single daemon
+# thread drains them in batches (one write + one flush per logger per batch).
+# Tradeoff: entries still in the queue when the process is killed (not a
+# clean exit) are lost — at most one batch of MAX_BATCH entries.
+MAX_BATCH = 1000
+_QUEUE = queue.SimpleQueue()
+_STOP = object()
+_INLINE_LOCK = threading.Lock()     # only used once the writer has stopped
+
+# Scratch buffer reused for every batch so lines are copied into one
+# preallocated block rather than joined into a fresh bytes object. Owned by
+# the writer thread (or by the inline path, under _INLINE_LOCK, once the
+# writer has stopped).
+SCRATCH_SIZE = 1 << 20
+_SCRATCH = memoryview(bytearray(SCRATCH_SIZE))
+
+
+def _write_lines(write, lines):
+    """Copy lines into the scratch buffer and pass it to `write` as it fills."""
+    off = 0
+    for line in lines:
+        n = len(line)
+        if off + n > SCRATCH_SIZE:
+            if off:
+                write(_SCRATCH[:off])
+                off = 0
+            if n > SCRATCH_SIZE:
+                write(line)
+                continue
+        _SCRATCH[off:off + n] = line
+        off += n
+    if off:
+        write(_SCRATCH[:off])
+
+
+def _process_batch(batch):
+    """Write one drained batch; returns (flush waiters, stop requested)."""
+    pending = {}    # logger -> [line, ...], insertion-ordered
+    console = []
+    waiters = []
+    stop = False
+    for item in batch:
+        if item is _STOP:
+            stop = True
+            continue
+        logger, payload, durable = item
+        if isinstance(payload, threading.Event):
+            waiters.append(payload)
+            continue
+        if logger is _CONSOLE:
+            console.append(payload)
+            continue
+        lines, force = pending.setdefault(logger, ([], [False]))
+        lines.append(payload)
+        if durable:
+            force[0] = True
+
+    for logger, (lines, force) in pending.items():
+        try:
+            logger._write_batch(lines, force_sync=force[0])
+        except Exception as e:
+            sys.stderr.write(f"[audit_logger] write failed for {logger.component}: {e}\n")
+    if console:
+        try:
+            _console_write(b"".join(console))
+        except Exception:
+            pass
+    return waiters, stop
+
+
+def _drain():
+    while True:
+        batch = [_QUEUE.get()]
+        while len(batch) <= MAX_BATCH:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        waiters, stop = _process_batch(batch)
+        batch = None
+        for ev in waiters:
+            ev.set()
+        if stop:
+            return
+
+
+_WRITER = threading.Thread(target=_drain, name="audit-writer", daemon=True)
+_WRITER.start()
+
+
+# Console mirror: lines for AuditLogger(console=True) are queued to the
+# writer thread as (_CONSOLE, bytes, False) and written to stderr once per
+# batch, bypassing the stdlib logging machinery.
+_CONSOLE = object()
+_CONSOLE_LEVEL_TAG = {
+    LogLevel.DEBUG: b"DEBUG: ",
+    LogLevel.INFO: b"INFO: ",
+    LogLevel.AUDIT: b"AUDIT: ",
+    LogLevel.WARN: b"WARNING: ",
+    LogLevel.ERROR: b"ERROR: ",
+    LogLevel.CRITICAL: b"CRITICAL: ",
+}
+
+_CAT_PREFIX = {
+    None: b"",
+    "": b"",
+    **{cat: f"[{cat}] ".encode("ascii") for cat in (
+        ErrorCategory.TRANSIENT, ErrorCategory.AUTH,
+        ErrorCategory.LOGIC, ErrorCategory.SYSTEM,
+    )},
+}
+
+
+def _console_write(data):
+    stream = getattr(sys.stderr, "buffer", None)
+    if stream is not None:
+        stream.write(data)
+        stream.flush()
+    else:
+        sys.stderr.write(data.decode("utf-8", "replace"))
+
+
+# Retention: one sweeper thread per process deletes audit_YYYY-MM-DD.jsonl
+# files older than the retention window of every registered logs dir.
+SWEEP_INTERVAL = 6 * 3600   # seconds
+_RETENTION = {}             # logs_dir -> retention_days (largest requested)
+_SWEEPER_STARTED = False
+_SWEEPER_LOCK = threading.Lock()
+
+
+def _register_retention(logs_dir, retention_days):
+    global _SWEEPER_STARTED
+    with _SWEEPER_LOCK:
+        _RETENTION[logs_dir] = max(retention_days, _RETENTION.get(logs_dir, 0))
+        if not _SWEEPER_STARTED:
+            threading.Thread(target=_sweep_loop, name="audit-sweeper", daemon=True).start()
+            _SWEEPER_STARTED = True
+
+
+def _sweep_loop():
+    while True:
+        with _SWEEPER_LOCK:
+            targets = list(_RETENTION.items())
+        for logs_dir, days in targets:
+            try:
+                purge_old_logs(logs_dir, days)
+            except OSError:
+                pass
+        time.sleep(SWEEP_INTERVAL)
+
+
+def purge_old_logs(logs_dir, retention_days):
+    """Delete audit_*.jsonl files older than retention_days. Returns count removed."""
+    today = date.today()
+    removed = 0
+    with os.scandir(logs_dir) as it:
+        for e in it:
+            name = e.name
+            # audit_YYYY-MM-DD.jsonl — slice the date rather than strptime
+            if not (name.startswith("audit_") and name.endswith(".jsonl")):
+                continue
+            try:
+                day = date.fromisoformat(name[6:16])
+            except ValueError:
+                continue
+            if (today - day).days > retention_days:
+                try:
+                    os.unlink(e.path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+    return removed
+
+
+@atexit.register
+def _close_all():
+    _QUEUE.put(_STOP)
+    _WRITER.join(timeout=5)
+    for logger in list(_LIVE_LOGGERS):
+        logger._close()
+
+
 class AuditLogger:
     """
     Structured JSON logger that writes to /Logs/audit_YYYY-MM-DD.jsonl
@@ -66,26 +330,69 @@ class AuditLogger:
     Each entry is a single JSON line (JSONL format) for easy parsing.
     """
 
-    def __init__(self, component="system", logs_dir=LOGS_DIR):
+    # Fixed attribute layout: the hot path reads several attributes per
+    # entry, and slot descriptors avoid a per-instance __dict__ lookup.
+    __slots__ = (
+        "component", "min_level", "_min_ord", "logs_dir", "_trace_id",
+        "_session_id", "_static_suffix", "_fd", "_fd_path", "_path_cache",
+        "sync_mode", "batch_n", "period", "_unsynced", "_last_sync", "_ts",
+        "retention_days", "_console", "_console_tag", "__weakref__",
+    )
+
+    SYNC_MODES = ("always", "batch", "periodic")
+    TS_MODES = ("iso", "unix_ns")
+
+    def __init__(self, component="system", logs_dir=LOGS_DIR,
+                 sync_mode="batch", batch_n=64, period_ms=50, ts_mode="iso",
+                 min_level=LogLevel.DEBUG, console=False, retention_days=30):
+        if min_level not in _LEVEL_ORD:
+            raise ValueError(f"min_level must be one of {tuple(_LEVEL_ORD)}, got {min_level!r}")
+        if sync_mode not in self.SYNC_MODES:
+            raise ValueError(f"sync_mode must be one of {self.SYNC_MODES}, got {sync_mode!r}")
+        if ts_mode not in self.TS_MODES:
+            raise ValueError(f"ts_mode must be one of {self.TS_MODES}, got {ts_mode!r}")
         self.component = component
+        self.min_level = min_level
+        self._min_ord = _LEVEL_ORD[min_level]
         self.logs_dir = Path(logs_dir)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self._trace_id = None
         self._session_id = str(uuid.uuid4())[:8]
-
-        # Also set up a Python logger for console output
-        self._py_logger = logging.getLogger(f"audit.{component}")
-        if not self._py_logger.handlers:
-            handler = logging.StreamHandler(
-                open(sys.stdout.fileno(), mode="w", encoding="utf-8", closefd=False)
-                if sys.platform == "win32"
-                else sys.stdout
-            )
-            handler.setFormatter(logging.Formatter(
-                "[%(asctime)s] [%(name)s] %(levelname)s: %(message)s"
-            ))
-            self._py_logger.addHandler(handler)
-            self._py_logger.setLevel(logging.DEBUG)
+        # Invariant fields pre-encoded once: b'"component":"...","session_id":"..."'
+        self._static_suffix = _dumps_line(
+            {"component": component, "session_id": self._session_id}
+        )[1:-2]
+
+        # Cached raw append fd, reopened only when the date rolls over
+        self._fd = None
+        self._fd_path = None
+        self._path_cache = (0.0, None)     # (monotonic time checked, path)
+        _LIVE_LOGGERS.add(self)
+
+        # fsync policy: "always" syncs every batch, "batch" every batch_n
+        # entries or period_ms (whichever first), "periodic" every period_ms.
+        # AUDIT entries are always synced before the batch is acknowledged.
+        self.sync_mode = sync_mode
+        self.batch_n = batch_n
+        self.period = period_ms / 1000.0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        # "iso" = local ISO-8601 string (ms precision), "unix_ns" = int epoch ns
+        self._ts = time.time_ns if ts_mode == "unix_ns" else _ts_now
+
+        # Old daily files are purged by the shared sweeper (None disables)
+        self.retention_days = retention_days
+        if retention_days is not None:
+            _register_retention(self.logs_dir, retention_days)
+
+        # Optional stderr mirror, written by the background writer
+        self._console = console
+        self._console_tag = f"] [audit.{component}] ".encode("utf-8")
+
+    def is_enabled(self, level):
+        """True if entries at `level` pass this logger's min_level."""
+        return _LEVEL_ORD.get(level, _LEVEL_ORD[LogLevel.CRITICAL]) >= self._min_ord
 
     @property
     def trace_id(self):
@@ -100,17 +407,121 @@ class AuditLogger:
         """End the current trace context."""
         tid = self._trace_id
         self._trace_id = None
+        self.flush()
         return tid
 
     def _log_file_path(self):
-        """Get today's log file path."""
-        return self.logs_dir / f"audit_{date.today().isoformat()}.jsonl"
+        """Get today's log file path (re-checked at most once per second)."""
+        now = time.monotonic()
+        last_t, last_p = self._path_cache
+        if last_p is not None and now - last_t < 1.0:
+            return last_p
+        path = self.logs_dir / f"audit_{date.today().isoformat()}.jsonl"
+        self._path_cache = (now, path)
+        return path
 
     def _write_entry(self, entry):
-        """Write a JSON entry to the log file."""
-        filepath = self._log_file_path()
-        with open(filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        """Queue a JSON entry (without the static fields) for the background writer."""
+        line = _dumps_line(entry)[:-2] + b"," + self._static_suffix + b"}\n"
+        self._enqueue(line, entry.get("level") == LogLevel.AUDIT)
+
+    def _fast_log(self, level, message, event):
+        """info()/debug() with no extra fields: build the line from pre-encoded bytes."""
+        if _LEVEL_ORD[level] < self._min_ord:
+            return None
+        ts = self._ts()
+        event_bytes = _EVENT_BYTES.get(event) or _dumps_value(event)
+        self._enqueue(b"".join((
+            b'{"ts":', _dumps_value(ts), _LEVEL_FRAGMENT[level], event_bytes,
+            b',"message":', _dumps_value(message), b",", self._static_suffix, b"}\n",
+        )), False)
+        return {
+            "ts": ts,
+            "level": level,
+            "event": event,
+            "message": message,
+            "component": self.component,
+            "session_id": self._session_id,
+        }
+
+    def _console_line(self, ts, level, category, event, message):
+        """Queue a human-readable mirror line for stderr."""
+        cat_prefix = _CAT_PREFIX.get(category)
+        if cat_prefix is None:
+            cat_prefix = f"[{category}] ".encode("utf-8")
+        line = b"".join((
+            b"[", str(ts).encode("ascii"), self._console_tag,
+            _CONSOLE_LEVEL_TAG.get(level, b"INFO: "), cat_prefix,
+            f"{event}: {message}\n".encode("utf-8"),
+        ))
+        if _WRITER.is_alive():
+            _QUEUE.put((_CONSOLE, line, False))
+        else:
+            _console_write(line)
+
+    def _enqueue(self, line, durable):
+        """Hand an encoded line to the background writer."""
+        if _WRITER.is_alive():
+            _QUEUE.put((self, line, durable))
+        else:
+            # Writer already stopped (interpreter shutdown) — write inline
+            with _INLINE_LOCK:
+                self._write_batch([line], force_sync=durable)
+
+    def _write_batch(self, lines, force_sync=False):
+        """Write a batch of encoded lines to the log file.
+
+        Only the writer thread calls this while it is running, so the file
+        handle needs no lock: producers never touch it, and __del__ cannot
+        run while queued entries still reference the logger.
+        """
+        path = self._log_file_path()
+        if self._fd is None or path != self._fd_path:
+            self._close()
+            self._fd = os.open(path, _OPEN_FLAGS, 0o644)
+            self._fd_path = path
+        _write_lines(self._write_all, lines)
+
+        self._unsynced += len(lines)
+        now = time.monotonic()
+        due = now - self._last_sync >= self.period
+        if (force_sync or self.sync_mode == "always"
+                or (self.sync_mode == "batch" and (self._unsynced >= self.batch_n or due))
+                or (self.sync_mode == "periodic" and due)):
+            _datasync(self._fd)
+            self._unsynced = 0
+            self._last_sync = now
+
+    def _write_all(self, data):
+        """os.write until every byte of `data` has been accepted."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def flush(self, timeout=5.0):
+        """Block until every entry queued so far has been written."""
+        if not _WRITER.is_alive():
+            return False
+        done = threading.Event()
+        _QUEUE.put((self, done, False))
+        return done.wait(timeout)
+
+    def _close(self):
+        """Sync and close the cached log file descriptor."""
+        if self._fd is not None:
+            fd, self._fd, self._fd_path = self._fd, None, None
+            try:
+                if self._unsynced:
+                    _datasync(fd)
+                    self._unsynced = 0
+            finally:
+                os.close(fd)
+
+    def __del__(self):
+        try:
+            self._close()
+        except Exception:
+            pass
 
     def log(
         self,
@@ -121,14 +532,16 @@ class AuditLogger:
         data: Optional[dict] = None,
         error: Optional[Exception] = None,
     ):
-        """Write a structured log entry."""
+        """Write a structured log entry. Returns None if below min_level."""
+        # Unknown level strings rank as CRITICAL so the gate never drops them
+        if _LEVEL_ORD.get(level, _LEVEL_ORD[LogLevel.CRITICAL]) < self._min_ord:
+            return None
+
         entry = {
-            "ts": datetime.now().isoformat(),
+            "ts": self._ts(),
             "level": level,
-            "component": self.component,
             "event": event,
             "message": message,
-            "session_id": self._session_id,
         }
 
         if category:
@@ -144,20 +557,25 @@ class AuditLogger:
             }
 
         self._write_entry(entry)
+        entry["component"] = self.component
+        entry["session_id"] = self._session_id
 
         # Also log to console
-        py_level = getattr(logging, level if level != "AUDIT" else "INFO", logging.INFO)
-        cat_prefix = f"[{category}] " if category else ""
-        self._py_logger.log(py_level, f"{cat_prefix}{event}: {message}")
+        if self._console:
+            self._console_line(entry["ts"], level, category, event, message)
 
         return entry
 
     # ── Convenience methods ──
 
     def debug(self, message, event="debug", **kwargs):
+        if not kwargs and self._trace_id is None and not self._console:
+            return self._fast_log(LogLevel.DEBUG, message, event)
         return self.log(LogLevel.DEBUG, message, event, **kwargs)
 
     def info(self, message, event="info", **kwargs):
+        if not kwargs and self._trace_id is None and not self._console:
+            return self._fast_log(LogLevel.INFO, message, event)
         return self.log(LogLevel.INFO, message, event, **kwargs)
 
     def warn(self, message, event="warning", **kwargs):
@@ -191,6 +609,8 @@ class AuditLogger:
 
     def retry_attempt(self, attempt, max_retries, error_msg, delay_ms, **kwargs):
         """Log a retry attempt."""
+        if _LEVEL_ORD[LogLevel.WARN] < self._min_ord:
+            return None
         return self.warn(
             f"Retry {attempt}/{max_retries}: {error_msg} (next in {delay_ms}ms)",
             event="retry_attempt",
@@ -200,6 +620,8 @@ class AuditLogger:
 
     def retry_exhausted(self, max_retries, error_msg, **kwargs):
         """Log when all retries are exhausted."""
+        if _LEVEL_ORD[LogLevel.ERROR] < self._min_ord:
+            return None
         return self.error(
             f"All {max_retries} retries exhausted: {error_msg}",
             event="retry_exhausted",
@@ -210,6 +632,8 @@ class AuditLogger:
 
     def retry_success(self, attempt, **kwargs):
         """Log successful retry."""
+        if _LEVEL_ORD[LogLevel.INFO] < self._min_ord:
+            return None
         return self.info(
             f"Succeeded on attempt {attempt}",
             event="retry_success",
@@ -221,6 +645,8 @@ class AuditLogger:
 
     def queued(self, task_desc, queue_file, reason, **kwargs):
         """Log a task being queued for later processing."""
+        if _LEVEL_ORD[LogLevel.WARN] < self._min_ord:
+            return None
         return self.warn(
             f"Queued: {task_desc} -> {queue_file} (reason: {reason})",
             event="task_queued",
@@ -230,6 +656,8 @@ class AuditLogger:
 
     def dequeued(self, task_desc, **kwargs):
         """Log a task being dequeued for processing."""
+        if _LEVEL_ORD[LogLevel.INFO] < self._min_ord:
+            return None
         return self.info(
             f"Dequeued: {task_desc}",
             event="task_dequeued",
@@ -247,27 +675,46 @@ class AuditLogger:
         if not filepath.exists():
             return entries
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+        match = _line_matcher(level, category, component)
+        for line in _iter_lines(filepath):
+            entry = match(line)
+            if entry is None:
+                continue
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
 
-                if level and entry.get("level") != level:
-                    continue
-                if category and entry.get("category") != category:
-                    continue
-                if component and entry.get("component") != component:
-                    continue
+        return entries
 
-                entries.append(entry)
-                if len(entries) >= limit:
-                    break
+    @staticmethod
+    def tail_logs(log_file, level=None, category=None, component=None, limit=100):
+        """Read the last `limit` matching entries (oldest first) by scanning back from EOF."""
+        entries = []
+        filepath = Path(log_file)
+        if not filepath.exists():
+            return entries
 
+        match = _line_matcher(level, category, component)
+        with open(filepath, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0 and len(entries) < limit:
+                step = min(TAIL_CHUNK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b"\n")
+                # The first piece may be the tail of a line that starts in an
+                # earlier chunk — hold it back until that chunk is read.
+                carry = lines.pop(0) if pos > 0 else b""
+                for line in reversed(lines):
+                    entry = match(line.strip())
+                    if entry is None:
+                        continue
+                    entries.append(entry)
+                    if len(entries) >= limit:
+                        break
+
+        entries.reverse()
         return entries
 
     @staticmethod
@@ -278,27 +725,84 @@ class AuditLogger:
         if not filepath.exists():
             return counts
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    cat = entry.get("category", "NONE")
-                    counts[cat] = counts.get(cat, 0) + 1
-                except (json.JSONDecodeError, AttributeError):
-                    continue
+        for line in _iter_lines(filepath):
+            # Every line is parsed: only valid JSON objects count, even as NONE
+            try:
+                entry = _loads(line)
+                cat = entry.get("category", "NONE")
+                counts[cat] = counts.get(cat, 0) + 1
+            except (_JSONDecodeError, AttributeError):
+                continue
 
         return counts
 
 
+def _iter_lines(filepath):
+    """Yield the stripped, non-empty byte lines of a file via mmap."""
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return      # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                nl = mm.find(b"\n", start)
+                if nl == -1:
+                    nl = size
+                line = mm[start:nl].strip()
+                start = nl + 1
+                if line:
+                    yield line
+
+
+def _line_matcher(level, category, component):
+    """Build a line -> entry-or-None filter shared by read_logs/tail_logs."""
+    # Cheap byte-level reject before parsing: a matching entry must
+    # contain the quoted filter value somewhere on the line.
+    needles = [n for n in (_needle(level), _needle(category), _needle(component)) if n]
+
+    def match(line):
+        if not line or (needles and not all(n in line for n in needles)):
+            return None
+        try:
+            entry = _loads(line)
+        except _JSONDecodeError:
+            return None
+        if not isinstance(entry, dict):
+            return None
+        if level and entry.get("level") != level:
+            return None
+        if category and entry.get("category") != category:
+            return None
+        if component and entry.get("component") != component:
+            return None
+        return entry
+
+    return match
+
+
+def _needle(value):
+    """Quoted byte form of a filter value, or None if it may be escaped on disk."""
+    if not value or not value.isascii() or '"' in value or "\\" in value:
+        return None
+    return b'"' + value.encode("ascii") + b'"'
+
+
 # ---------------------------------------------------------------------------
 # Module-level convenience
 # ---------------------------------------------------------------------------
-_default_logger = None
+_LOGGERS = {}
+_LOGGERS_LOCK = threading.Lock()
 
 
 def get_logger(component="system"):
-    """Get or create an AuditLogger for the given component."""
-    global _default_logger
-    if _default_logger is None or _default_logger.component != component:
-        _default_logger = AuditLogger(component=component)
-    return _default_logger
+    """Get or create the shared AuditLogger for the given component."""
+    try:
+        return _LOGGERS[component]
+    except KeyError:
+        pass
+    with _LOGGERS_LOCK:
+        logger = _LOGGERS.get(component)
+        if logger is None:
+            logger = _LOGGERS[component] = AuditLogger(component=component)
+        return logger
@@ -18,11 +18,17 @@ CLI:
   python ceo_briefing.py --week 2026-W08 # Specific week label
 """
 
+import io
 import os
 import re
 import sys
+import stat
 import glob
 import logging
+import logging.handlers
+import operator
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -49,27 +55,139 @@ SUBSCRIPTION_WARN_THRESHOLD = 200  # Warn on subscriptions > $200/mo
 LOW_BALANCE_THRESHOLD = 10000      # Warn if balance < $10k
 REVENUE_TARGET_MONTHLY = 30000     # Monthly revenue target
 
+# Patterns compiled once at import rather than looked up per call
+_GOAL_RE = re.compile(r"\d+\.\s+\*\*(.+?)\*\*\s*—\s*(.+)")
+_FM_OPEN_RE = re.compile(r"---\s*\n")
+_FM_CLOSE_RE = re.compile(r"\n---\s*\n")
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s] [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(str(LOG_FILE), encoding="utf-8"),
-        logging.StreamHandler(
-            open(sys.stdout.fileno(), mode="w", encoding="utf-8", closefd=False)
-            if sys.platform == "win32"
-            else sys.stdout
-        ),
-    ],
-)
 logger = logging.getLogger("ceo_briefing")
+_LOG_FORMAT = "[%(asctime)s] [%(levelname)s] %(message)s"
+_stdout_stream = None
+
+
+def _init_logging():
+    """Attach the file and console handlers on first use, not at import.
+
+    Importing the module (tests, other scripts) leaves LOG_FILE closed and
+    stdout untouched; the entry points call this instead. File records are
+    buffered and written in batches — immediately for ERROR and above, and
+    at _flush_logs() / interpreter exit otherwise.
+    """
+    global _stdout_stream
+    if _stdout_stream is not None:
+        return
+    _stdout_stream = (
+        open(sys.stdout.fileno(), mode="w", encoding="utf-8", closefd=False)
+        if sys.platform == "win32"
+        else sys.stdout
+    )
+    file_handler = logging.FileHandler(str(LOG_FILE), encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    logging.basicConfig(
+        level=logging.INFO,
+        format=_LOG_FORMAT,
+        handlers=[
+            logging.handlers.MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=file_handler
+            ),
+            logging.StreamHandler(_stdout_stream),
+        ],
+    )
+
+
+def _flush_logs():
+    """Push any buffered log records out to LOG_FILE."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
 
 
 # ---------------------------------------------------------------------------
 # Step 1: Parse Bank Transactions
 # ---------------------------------------------------------------------------
+_SUMMARY_LABELS = ("Total Income:", "Total Expenses:", "Current Balance:")
+_AMOUNT_CHARS = frozenset("0123456789,.")
+_MONEY_TABLE = str.maketrans("", "", "$,")
+_by_cost = operator.itemgetter("amount_abs")
+
+
+def _is_amount(text, signed=False):
+    """Match [+-]?$?[0-9,.]+ without regex."""
+    if signed and text[:1] in ("+", "-"):
+        text = text[1:]
+    if text[:1] == "$":
+        text = text[1:]
+    return bool(text) and all(c in _AMOUNT_CHARS for c in text)
+
+
+def _is_date(text):
+    """Match YYYY-MM-DD without regex."""
+    return (len(text) == 10 and text[4] == "-" and text[7] == "-"
+            and text[:4].isdigit() and text[5:7].isdigit() and text[8:].isdigit())
+
+
+def _parse_table_rows(line):
+    """Yield (date, desc, category, amount, balance) for each
+    '| date | desc | category | amount | balance |' run in a line.
+
+    Fields are read left to right: a row may start after other text, carry
+    extra trailing columns, and its description may contain '|' (the
+    shortest description after which the fixed fields fit wins).
+    """
+    parts = line.split("|")
+    last = len(parts) - 1          # parts[last] follows the final '|'
+    i = 0
+    while i + 5 < last:
+        date_str = parts[i + 1].strip()
+        if not _is_date(date_str):
+            i += 1
+            continue
+        # Description spans parts[i+2 : d]; category/amount/balance follow it
+        for d in range(i + 3, last - 2):
+            category = parts[d].strip()
+            amount_str = parts[d + 1].strip()
+            balance_str = parts[d + 2].strip()
+            if (category and all(c.isalnum() or c == "_" for c in category)
+                    and _is_amount(amount_str, signed=True) and _is_amount(balance_str)):
+                desc = "|".join(parts[i + 2:d]).strip()
+                # Interned: a handful of category names repeat across every row
+                yield date_str, desc, sys.intern(category.lower()), amount_str, balance_str.lstrip("$")
+                i = d + 3           # the row's closing '|' is consumed
+                break
+        else:
+            i += 1
+
+
+def _is_separator_row(line):
+    """True for '|---|:---:|' style table rules."""
+    return all(c in "|-: \t" for c in line)
+
+
+def _summary_amount(line, label):
+    """Pull the number following e.g. 'Total Income:** $28,200.00'."""
+    pos = line.find(label)
+    while pos >= 0:
+        rest = line[pos + len(label):]
+        stars = 0
+        while stars < 2 and rest[stars:stars + 1] == "*":
+            stars += 1
+        rest = rest[stars:].lstrip()
+        if rest[:1] == "$":
+            rest = rest[1:]
+        end = 0
+        while end < len(rest) and rest[end] in _AMOUNT_CHARS:
+            end += 1
+        if end:
+            try:
+                return float(rest[:end].translate(_MONEY_TABLE))
+            except ValueError:
+                return None
+        pos = line.find(label, pos + 1)
+    return None
+
+
 def parse_bank_transactions(filepath):
     """Parse Bank_Transactions.md into structured data."""
     transactions = []
@@ -79,144 +197,210 @@ def parse_bank_transactions(filepath):
 
     if not filepath.exists():
         logger.warning(f"Bank file not found: {filepath}")
-        return {
+        return compute_aggregates({
             "transactions": [],
+            "income": [],
             "balance": 0,
             "total_income": 0,
             "total_expenses": 0,
             "categories": {},
             "subscriptions": [],
+            "subscriptions_by_cost": [],
             "flagged": [],
-        }
+        })
 
     content = filepath.read_text(encoding="utf-8")
-
-    # Parse table rows
-    table_pattern = re.compile(
-        r"\|\s*(\d{4}-\d{2}-\d{2})\s*\|\s*(.+?)\s*\|\s*(\w+)\s*\|\s*([+-]?\$?[\d,.]+)\s*\|\s*\$?([\d,.]+)\s*\|"
-    )
-
-    for match in table_pattern.finditer(content):
-        date_str, desc, category, amount_str, balance_str = match.groups()
-        desc = desc.strip()
-        category = category.strip().lower()
-
-        # Parse amount
-        amount_clean = amount_str.replace("$", "").replace(",", "").strip()
-        if amount_clean == "—" or amount_clean == "":
-            continue
-
-        try:
-            amount = float(amount_clean)
-        except ValueError:
-            continue
-
-        try:
-            balance = float(balance_str.replace(",", ""))
-        except ValueError:
-            balance = current_balance
-
-        current_balance = balance
-
-        txn = {
-            "date": date_str,
-            "description": desc,
-            "category": category,
-            "amount": amount,
-            "balance": balance,
-        }
-        transactions.append(txn)
-
-        if amount > 0:
-            total_income += amount
-        else:
-            total_expenses += abs(amount)
-
-    # Categorize expenses
-    categories = {}
+    summary = {}
+    categories = defaultdict(lambda: {"total": 0.0, "count": 0})
+    income = []
     subscriptions = []
     flagged = []
 
-    for txn in transactions:
-        cat = txn["category"]
-        amt = abs(txn["amount"])
+    # Single pass: table rows and the MTD summary lines are picked out of the
+    # same line walk, with plain string splitting instead of regex, and each
+    # row is categorized/flagged as soon as it is parsed.
+    for line in content.splitlines():
+        for label in _SUMMARY_LABELS:
+            if label not in summary and label in line:
+                value = _summary_amount(line, label)
+                if value is not None:
+                    summary[label] = value
+
+        if "|" not in line:
+            continue
 
-        if cat not in categories:
-            categories[cat] = {"total": 0, "count": 0, "items": []}
-        categories[cat]["total"] += amt
-        categories[cat]["count"] += 1
-        categories[cat]["items"].append(txn["description"])
+        rows = list(_parse_table_rows(line))
+        if not rows and not _is_separator_row(line):
+            first_cell = line.strip().lstrip("|").partition("|")[0].strip()
+            if _is_date(first_cell):
+                logger.warning(f"Skipping unparseable transaction row: {line.strip()}")
+            else:
+                logger.debug(f"Skipping non-transaction table row: {line.strip()}")
+
+        for date_str, desc, category, amount_str, balance_str in rows:
+            # Parse amount
+            amount_clean = amount_str.translate(_MONEY_TABLE).strip()
+            if amount_clean == "—" or amount_clean == "":
+                continue
+
+            try:
+                amount = float(amount_clean)
+            except ValueError:
+                continue
+
+            try:
+                balance = float(balance_str.translate(_MONEY_TABLE))
+            except ValueError:
+                balance = current_balance
+
+            current_balance = balance
+
+            amt = amount if amount >= 0 else -amount
+            txn = {
+                "date": date_str,
+                "description": desc,
+                "category": category,
+                "amount": amount,
+                "amount_abs": amt,
+                "balance": balance,
+            }
+            transactions.append(txn)
+
+            # Categorize, detect subscriptions and flag in the same pass
+            if amount > 0:
+                total_income += amount
+                income.append(txn)
+            else:
+                total_expenses += amt
 
-        # Detect subscriptions
-        if cat == "subscription":
-            subscriptions.append(txn)
+            cat_entry = categories[category]
+            cat_entry["total"] += amt
+            cat_entry["count"] += 1
 
-        # Flag large expenses (audit_logic pattern)
-        if txn["amount"] < 0 and amt > EXPENSE_FLAG_THRESHOLD:
-            flagged.append(txn)
+            if category == "subscription":
+                subscriptions.append(txn)
 
-    # Also parse the summary section for totals
-    income_match = re.search(r"Total Income:\*?\*?\s*\$?([\d,.]+)", content)
-    expense_match = re.search(r"Total Expenses:\*?\*?\s*\$?([\d,.]+)", content)
-    balance_match = re.search(r"Current Balance:\*?\*?\s*\$?([\d,.]+)", content)
+            # Flag large expenses (audit_logic pattern)
+            if amount < 0 and amt > EXPENSE_FLAG_THRESHOLD:
+                flagged.append(txn)
 
-    if income_match:
-        total_income = float(income_match.group(1).replace(",", ""))
-    if expense_match:
-        total_expenses = float(expense_match.group(1).replace(",", ""))
-    if balance_match:
-        current_balance = float(balance_match.group(1).replace(",", ""))
+    # Summary section totals override the row sums when present
+    total_income = summary.get("Total Income:", total_income)
+    total_expenses = summary.get("Total Expenses:", total_expenses)
+    current_balance = summary.get("Current Balance:", current_balance)
 
-    return {
+    return compute_aggregates({
         "transactions": transactions,
+        "income": income,
         "balance": current_balance,
         "total_income": total_income,
         "total_expenses": total_expenses,
-        "categories": categories,
+        "categories": dict(categories),
         "subscriptions": subscriptions,
+        "subscriptions_by_cost": sorted(subscriptions, key=_by_cost, reverse=True),
         "flagged": flagged,
-    }
+    })
+
+
+def compute_aggregates(bank_data):
+    """Add the derived figures every later step reads: sub_total, net,
+    revenue_pct and expense_ratio (None when there is no income)."""
+    income = bank_data["total_income"]
+    expenses = bank_data["total_expenses"]
+    # The parse loop already summed the subscription category; reuse it
+    sub_cat = bank_data["categories"].get("subscription")
+    bank_data["sub_total"] = sub_cat["total"] if sub_cat else 0.0
+    bank_data["net"] = income - expenses
+    bank_data["revenue_pct"] = (
+        (income / REVENUE_TARGET_MONTHLY * 100)
+        if REVENUE_TARGET_MONTHLY > 0
+        else 0
+    )
+    bank_data["expense_ratio"] = expenses / income * 100 if income > 0 else None
+    return bank_data
 
 
 # ---------------------------------------------------------------------------
 # Step 2: Parse Completed Tasks
 # ---------------------------------------------------------------------------
+def _split_frontmatter(content):
+    """
+    Split '---' delimited frontmatter from the body; None if there is none.
+    Either delimiter line may carry trailing whitespace (hand-edited notes).
+    """
+    start = _FM_OPEN_RE.match(content)
+    if not start:
+        return None
+    end = _FM_CLOSE_RE.search(content, start.end())
+    if not end:
+        # The greedy opening may have swallowed the newline that precedes
+        # the closing '---'; retry from the end of the first line
+        first = content.index("\n") + 1
+        if first == start.end():
+            return None
+        end = _FM_CLOSE_RE.search(content, first)
+        if not end:
+            return None
+        return content[first:end.start()], content[end.end():]
+    return content[start.end():end.start()], content[end.end():]
+
+
+def _read_text(path):
+    """Read a UTF-8 file as bytes and decode once, normalising newlines like text mode."""
+    with open(path, "rb") as f:
+        content = f.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _parse_task_file(entry):
+    """Read and parse one task note; pure, so it can run on a worker thread."""
+    name, path = entry
+    content = _read_text(path)
+    task = {
+        "file": name,
+        "task": "",
+        "completed": "",
+        "category": "",
+        "result": "",
+        "body": "",
+    }
+
+    # Parse YAML frontmatter
+    split = _split_frontmatter(content)
+    if split:
+        frontmatter, body = split
+        task["body"] = body.strip()
+
+        for line in frontmatter.split("\n"):
+            key, sep, val = line.partition(":")
+            if sep:
+                # Keys repeat across every note, so share one str per key
+                task[sys.intern(key.strip())] = val.strip()
+    else:
+        task["body"] = content.strip()
+
+    return task
+
+
 def parse_completed_tasks(tasks_dir):
     """Parse /Tasks/Done/*.md files with YAML frontmatter."""
-    tasks = []
-
     if not tasks_dir.exists():
         logger.warning(f"Tasks/Done dir not found: {tasks_dir}")
-        return tasks
-
-    for filepath in sorted(tasks_dir.glob("*.md")):
-        content = filepath.read_text(encoding="utf-8")
-
-        task = {
-            "file": filepath.name,
-            "task": "",
-            "completed": "",
-            "category": "",
-            "result": "",
-            "body": "",
-        }
-
-        # Parse YAML frontmatter
-        fm_match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", content, re.DOTALL)
-        if fm_match:
-            frontmatter, body = fm_match.groups()
-            task["body"] = body.strip()
-
-            for line in frontmatter.split("\n"):
-                if ":" in line:
-                    key, val = line.split(":", 1)
-                    task[key.strip()] = val.strip()
-        else:
-            task["body"] = content.strip()
+        return []
 
-        tasks.append(task)
+    with os.scandir(tasks_dir) as it:
+        entries = sorted(
+            (e.name, e.path) for e in it if e.name.endswith(".md") and e.is_file()
+        )
 
-    return tasks
+    # File reads release the GIL, so overlap them; map() keeps filename order
+    if len(entries) > 1:
+        workers = min(8, (os.cpu_count() or 1) * 2, len(entries))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_parse_task_file, entries))
+    return [_parse_task_file(entry) for entry in entries]
 
 
 # ---------------------------------------------------------------------------
@@ -231,23 +415,71 @@ def parse_goals(filepath):
     focus_areas = []
 
     # Extract numbered focus areas
-    for match in re.finditer(
-        r"\d+\.\s+\*\*(.+?)\*\*\s*—\s*(.+)", content
-    ):
+    for match in _GOAL_RE.finditer(content):
         focus_areas.append({"name": match.group(1), "target": match.group(2)})
 
     return {"focus_areas": focus_areas, "raw": content}
 
 
+# ---------------------------------------------------------------------------
+# Parse cache: reuse parsed inputs until the source changes on disk
+# ---------------------------------------------------------------------------
+_PARSE_CACHE = {}
+
+
+def _source_signature(path):
+    """(mtime, size) of a file — or of every entry in a directory; None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return st.st_mtime_ns, st.st_size
+    with os.scandir(path) as it:
+        return tuple(sorted(
+            (e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in it
+        ))
+
+
+def load_cached(parser, path):
+    """Call parser(path), reusing the previous result while path is unchanged.
+
+    Results are shared between callers and must be treated as read-only.
+    """
+    key = (parser.__name__, str(path))
+    sig = _source_signature(path)
+    hit = _PARSE_CACHE.get(key)
+    if hit is not None and sig is not None and hit[0] == sig:
+        return hit[1]
+    result = parser(path)
+    _PARSE_CACHE[key] = (sig, result)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Step 4: Bottleneck Detection (audit_logic pattern)
 # ---------------------------------------------------------------------------
+_SEV_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+_SEV_ICONS_BY_CODE = ("RED", "YELLOW", "BLUE", "")  # indexed by '_sev'
+_by_sev = operator.itemgetter("_sev")
+
+
+def _rank(items, field):
+    """Tag each item with an integer '_sev' rank and stable-sort on it."""
+    for item in items:
+        item["_sev"] = _SEV_ORDER.get(item[field], 3)
+    items.sort(key=_by_sev)
+    return items
+
+
 def detect_bottlenecks(bank_data, tasks, goals):
     """
     Identify bottlenecks using audit_logic patterns:
     - Threshold checks
     - Rule-based anomaly detection
     - Category analysis
+
+    Returned highest severity first.
     """
     bottlenecks = []
 
@@ -261,11 +493,7 @@ def detect_bottlenecks(bank_data, tasks, goals):
         })
 
     # 2. Revenue vs target
-    revenue_pct = (
-        (bank_data["total_income"] / REVENUE_TARGET_MONTHLY * 100)
-        if REVENUE_TARGET_MONTHLY > 0
-        else 0
-    )
+    revenue_pct = bank_data["revenue_pct"]
     if revenue_pct < 80:
         bottlenecks.append({
             "area": "Revenue",
@@ -275,7 +503,7 @@ def detect_bottlenecks(bank_data, tasks, goals):
         })
 
     # 3. Subscription bloat
-    sub_total = sum(abs(s["amount"]) for s in bank_data["subscriptions"])
+    sub_total = bank_data["sub_total"]
     if sub_total > 1500:
         bottlenecks.append({
             "area": "Subscriptions",
@@ -286,11 +514,11 @@ def detect_bottlenecks(bank_data, tasks, goals):
 
     # 4. High individual subscriptions
     for sub in bank_data["subscriptions"]:
-        if abs(sub["amount"]) > SUBSCRIPTION_WARN_THRESHOLD:
+        if sub["amount_abs"] > SUBSCRIPTION_WARN_THRESHOLD:
             bottlenecks.append({
                 "area": "Subscription",
                 "severity": "LOW",
-                "issue": f"{sub['description']}: ${abs(sub['amount']):,.2f}/month",
+                "issue": f"{sub['description']}: ${sub['amount_abs']:,.2f}/month",
                 "impact": "Consider if ROI justifies cost",
             })
 
@@ -299,57 +527,53 @@ def detect_bottlenecks(bank_data, tasks, goals):
         bottlenecks.append({
             "area": "Expense",
             "severity": "MEDIUM",
-            "issue": f"{txn['description']}: ${abs(txn['amount']):,.2f} exceeds ${EXPENSE_FLAG_THRESHOLD} threshold",
+            "issue": f"{txn['description']}: ${txn['amount_abs']:,.2f} exceeds ${EXPENSE_FLAG_THRESHOLD} threshold",
             "impact": "Requires manager approval per Company Handbook Rule #2",
         })
 
     # 6. Expense-to-income ratio
-    if bank_data["total_income"] > 0:
-        expense_ratio = bank_data["total_expenses"] / bank_data["total_income"] * 100
-        if expense_ratio > 90:
-            bottlenecks.append({
-                "area": "Burn Rate",
-                "severity": "HIGH",
-                "issue": f"Expenses are {expense_ratio:.0f}% of income (${bank_data['total_expenses']:,.2f} / ${bank_data['total_income']:,.2f})",
-                "impact": "Thin margins — risk of cash flow issues",
-            })
+    expense_ratio = bank_data["expense_ratio"]
+    if expense_ratio is not None and expense_ratio > 90:
+        bottlenecks.append({
+            "area": "Burn Rate",
+            "severity": "HIGH",
+            "issue": f"Expenses are {expense_ratio:.0f}% of income (${bank_data['total_expenses']:,.2f} / ${bank_data['total_income']:,.2f})",
+            "impact": "Thin margins — risk of cash flow issues",
+        })
 
-    # 7. Incomplete tasks / goals alignment
-    completed_categories = {}
-    for t in tasks:
-        cat = t.get("category", "other")
-        completed_categories[cat] = completed_categories.get(cat, 0) + 1
+    # 7. Incomplete tasks / goals alignment — only the project count is needed
+    project_tasks = sum(1 for t in tasks if t.get("category") == "project")
 
-    if completed_categories.get("project", 0) < 2:
+    if project_tasks < 2:
         bottlenecks.append({
             "area": "Delivery",
             "severity": "LOW",
-            "issue": f"Only {completed_categories.get('project', 0)} project tasks completed this period",
+            "issue": f"Only {project_tasks} project tasks completed this period",
             "impact": "May affect client satisfaction and future revenue",
         })
 
-    return bottlenecks
+    return _rank(bottlenecks, "severity")
 
 
 # ---------------------------------------------------------------------------
 # Step 5: Generate Suggestions (audit_logic pattern)
 # ---------------------------------------------------------------------------
 def generate_suggestions(bank_data, tasks, goals, bottlenecks):
-    """Generate actionable suggestions based on data analysis."""
+    """Generate actionable suggestions based on data analysis, highest priority first."""
     suggestions = []
 
     # 1. Subscription optimization
     subs = bank_data["subscriptions"]
-    sub_total = sum(abs(s["amount"]) for s in subs)
+    sub_total = bank_data["sub_total"]
     if sub_total > 1000:
         # Find least essential subscriptions
         low_value = [
             s for s in subs
-            if abs(s["amount"]) < 150 and "zoom" not in s["description"].lower()
+            if s["amount_abs"] < 150 and "zoom" not in s["description"].lower()
         ]
         if low_value:
             names = [s["description"] for s in low_value]
-            savings = sum(abs(s["amount"]) for s in low_value)
+            savings = sum(s["amount_abs"] for s in low_value)
             suggestions.append({
                 "category": "Cost Reduction",
                 "action": f"Review low-cost subscriptions: {', '.join(names)}",
@@ -398,9 +622,9 @@ def generate_suggestions(bank_data, tasks, goals, bottlenecks):
         })
 
     # 6. Goal alignment check
+    task_names = " ".join(t.get("task", "").lower() for t in tasks)
     for goal in goals.get("focus_areas", []):
         goal_name = goal["name"].lower()
-        task_names = " ".join(t.get("task", "").lower() for t in tasks)
         if goal_name not in task_names and "lead" not in task_names:
             suggestions.append({
                 "category": "Strategy",
@@ -409,14 +633,38 @@ def generate_suggestions(bank_data, tasks, goals, bottlenecks):
                 "priority": "LOW",
             })
 
-    return suggestions
+    return _rank(suggestions, "priority")
 
 
 # ---------------------------------------------------------------------------
 # Step 6: Generate Briefing Markdown
 # ---------------------------------------------------------------------------
-def generate_briefing(bank_data, tasks, goals, bottlenecks, suggestions, week_label=None):
-    """Assemble the full Monday Morning CEO Briefing."""
+def generate_briefing(bank_data, tasks, goals, bottlenecks, suggestions, week_label=None,
+                      out=None, sections=None):
+    """Assemble the full Monday Morning CEO Briefing.
+
+    Writes to `out` (any object with .write) when given and returns the
+    (chars, lines) written; otherwise builds the document in memory and
+    returns it as a string. If a `sections` dict is passed it is filled with
+    heading title -> character offset of that heading in the output.
+    """
+    buf = None
+    if out is None:
+        buf = out = io.StringIO()
+    out_write = out.write
+    chars = lines = 0
+
+    def write(text):
+        nonlocal chars, lines
+        chars += len(text)
+        lines += text.count("\n")
+        out_write(text)
+
+    def heading(title, marks="##"):
+        if sections is not None:
+            sections[title] = chars
+        write(f"{marks} {title}\n")
+
     now = datetime.now()
     if not week_label:
         # Calculate ISO week
@@ -426,74 +674,74 @@ def generate_briefing(bank_data, tasks, goals, bottlenecks, suggestions, week_la
     period_end = now.strftime("%Y-%m-%d")
 
     # YAML frontmatter
-    lines = [
-        "---",
-        f"title: Monday Morning CEO Briefing — {week_label}",
-        f"generated: {now.isoformat()}",
-        f"period: {period_start} to {period_end}",
-        f"type: ceo_briefing",
-        f"version: 1.0",
-        f"status: generated",
-        f"revenue_mtd: {bank_data['total_income']:.2f}",
-        f"expenses_mtd: {bank_data['total_expenses']:.2f}",
-        f"balance: {bank_data['balance']:.2f}",
-        f"tasks_completed: {len(tasks)}",
-        f"bottlenecks_count: {len(bottlenecks)}",
-        f"suggestions_count: {len(suggestions)}",
-        "---",
-        "",
-        f"# Monday Morning CEO Briefing",
-        f"### {week_label} | Generated {now.strftime('%B %d, %Y at %I:%M %p')}",
-        "",
-        "---",
-        "",
-    ]
+    write(
+        "---\n"
+        f"title: Monday Morning CEO Briefing — {week_label}\n"
+        f"generated: {now.isoformat()}\n"
+        f"period: {period_start} to {period_end}\n"
+        "type: ceo_briefing\n"
+        "version: 1.0\n"
+        "status: generated\n"
+        f"revenue_mtd: {bank_data['total_income']:.2f}\n"
+        f"expenses_mtd: {bank_data['total_expenses']:.2f}\n"
+        f"balance: {bank_data['balance']:.2f}\n"
+        f"tasks_completed: {len(tasks)}\n"
+        f"bottlenecks_count: {len(bottlenecks)}\n"
+        f"suggestions_count: {len(suggestions)}\n"
+        "---\n"
+        "\n"
+        "# Monday Morning CEO Briefing\n"
+        f"### {week_label} | Generated {now.strftime('%B %d, %Y at %I:%M %p')}\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
 
     # ── Executive Summary ──
-    net = bank_data["total_income"] - bank_data["total_expenses"]
+    net = bank_data["net"]
     net_sign = "+" if net >= 0 else ""
-    revenue_pct = (
-        (bank_data["total_income"] / REVENUE_TARGET_MONTHLY * 100)
-        if REVENUE_TARGET_MONTHLY > 0
-        else 0
-    )
+    revenue_pct = bank_data["revenue_pct"]
 
     high_bottlenecks = [b for b in bottlenecks if b["severity"] == "HIGH"]
 
-    lines.extend([
-        "## Executive Summary",
-        "",
-        f"- **Current Balance:** ${bank_data['balance']:,.2f}",
-        f"- **MTD Revenue:** ${bank_data['total_income']:,.2f} ({revenue_pct:.0f}% of ${REVENUE_TARGET_MONTHLY:,} target)",
-        f"- **MTD Expenses:** ${bank_data['total_expenses']:,.2f}",
-        f"- **Net Position:** {net_sign}${abs(net):,.2f}",
-        f"- **Tasks Completed:** {len(tasks)}",
-        f"- **Bottlenecks:** {len(bottlenecks)} ({len(high_bottlenecks)} high severity)",
-        "",
-    ])
+    heading("Executive Summary")
+    write(
+        "\n"
+        f"- **Current Balance:** ${bank_data['balance']:,.2f}\n"
+        f"- **MTD Revenue:** ${bank_data['total_income']:,.2f} ({revenue_pct:.0f}% of ${REVENUE_TARGET_MONTHLY:,} target)\n"
+        f"- **MTD Expenses:** ${bank_data['total_expenses']:,.2f}\n"
+        f"- **Net Position:** {net_sign}${abs(net):,.2f}\n"
+        f"- **Tasks Completed:** {len(tasks)}\n"
+        f"- **Bottlenecks:** {len(bottlenecks)} ({len(high_bottlenecks)} high severity)\n"
+        "\n"
+    )
 
     # ── Financial Overview ──
-    lines.extend([
-        "## Financial Overview",
-        "",
-        "### Revenue Breakdown",
-        "",
-        "| Source | Amount | Date |",
-        "|--------|--------|------|",
-    ])
-
-    income_txns = [t for t in bank_data["transactions"] if t["amount"] > 0]
-    for txn in income_txns:
-        lines.append(f"| {txn['description']} | ${txn['amount']:,.2f} | {txn['date']} |")
-
-    lines.extend([
-        f"| **Total** | **${bank_data['total_income']:,.2f}** | |",
-        "",
-        "### Expense Breakdown by Category",
-        "",
-        "| Category | Total | Items | % of Expenses |",
-        "|----------|-------|-------|---------------|",
-    ])
+    heading("Financial Overview")
+    write("\n")
+    heading("Revenue Breakdown", "###")
+    write(
+        "\n"
+        "| Source | Amount | Date |\n"
+        "|--------|--------|------|\n"
+    )
+
+    # Row-per-record tables are rendered with one join and a single write
+    write("".join([
+        f"| {txn['description']} | ${txn['amount']:,.2f} | {txn['date']} |\n"
+        for txn in bank_data["income"]
+    ]))
+
+    write(
+        f"| **Total** | **${bank_data['total_income']:,.2f}** | |\n"
+        "\n"
+    )
+    heading("Expense Breakdown by Category", "###")
+    write(
+        "\n"
+        "| Category | Total | Items | % of Expenses |\n"
+        "|----------|-------|-------|---------------|\n"
+    )
 
     # Sort categories by total
     sorted_cats = sorted(
@@ -504,124 +752,143 @@ def generate_briefing(bank_data, tasks, goals, bottlenecks, suggestions, week_la
     for cat, data in sorted_cats:
         if data["total"] > 0 and cat != "income" and cat != "—":
             pct = (data["total"] / bank_data["total_expenses"] * 100) if bank_data["total_expenses"] > 0 else 0
-            lines.append(
-                f"| {cat.title()} | ${data['total']:,.2f} | {data['count']} | {pct:.1f}% |"
-            )
+            write(f"| {cat.title()} | ${data['total']:,.2f} | {data['count']} | {pct:.1f}% |\n")
 
-    lines.extend([
-        f"| **Total** | **${bank_data['total_expenses']:,.2f}** | | **100%** |",
-        "",
-    ])
+    write(
+        f"| **Total** | **${bank_data['total_expenses']:,.2f}** | | **100%** |\n"
+        "\n"
+    )
 
     # ── Subscriptions ──
     if bank_data["subscriptions"]:
-        sub_total = sum(abs(s["amount"]) for s in bank_data["subscriptions"])
-        lines.extend([
-            "### Active Subscriptions",
-            "",
-            "| Service | Monthly Cost | Status |",
-            "|---------|-------------|--------|",
-        ])
-        for sub in sorted(bank_data["subscriptions"], key=lambda s: abs(s["amount"]), reverse=True):
-            flag = " **FLAG**" if abs(sub["amount"]) > SUBSCRIPTION_WARN_THRESHOLD else ""
-            lines.append(f"| {sub['description']} | ${abs(sub['amount']):,.2f} | Active{flag} |")
-        lines.extend([
-            f"| **Total Subscriptions** | **${sub_total:,.2f}/month** | |",
-            "",
-        ])
+        sub_total = bank_data["sub_total"]
+        heading("Active Subscriptions", "###")
+        write(
+            "\n"
+            "| Service | Monthly Cost | Status |\n"
+            "|---------|-------------|--------|\n"
+        )
+        write("".join([
+            f"| {sub['description']} | ${sub['amount_abs']:,.2f} | Active"
+            f"{' **FLAG**' if sub['amount_abs'] > SUBSCRIPTION_WARN_THRESHOLD else ''} |\n"
+            for sub in bank_data["subscriptions_by_cost"]
+        ]))
+        write(
+            f"| **Total Subscriptions** | **${sub_total:,.2f}/month** | |\n"
+            "\n"
+        )
 
     # ── Completed Tasks ──
-    lines.extend([
-        "## Tasks Completed This Period",
-        "",
-        "| Task | Category | Completed | Result |",
-        "|------|----------|-----------|--------|",
-    ])
-    for task in tasks:
-        lines.append(
-            f"| {task['task']} | {task.get('category', 'N/A')} | {task.get('completed', 'N/A')} | {task.get('result', '')} |"
-        )
-    lines.append("")
+    heading("Tasks Completed This Period")
+    write(
+        "\n"
+        "| Task | Category | Completed | Result |\n"
+        "|------|----------|-----------|--------|\n"
+    )
+    write("".join([
+        f"| {task['task']} | {task.get('category', 'N/A')} | {task.get('completed', 'N/A')} | {task.get('result', '')} |\n"
+        for task in tasks
+    ]))
+    write("\n")
 
     # ── Goals Progress ──
-    lines.extend([
-        "## Goals Progress",
-        "",
-    ])
+    heading("Goals Progress")
+    write("\n")
     if goals.get("focus_areas"):
-        lines.extend([
-            "| Goal | Target | Status |",
-            "|------|--------|--------|",
-        ])
+        write(
+            "| Goal | Target | Status |\n"
+            "|------|--------|--------|\n"
+        )
+        # Lower-case task names/categories once, not once per goal
+        task_index = [
+            (t.get("task", "").lower(), t.get("category", "").lower())
+            for t in tasks
+        ]
         for goal in goals["focus_areas"]:
             # Check if any tasks relate to this goal
             goal_lower = goal["name"].lower()
-            related = [
-                t for t in tasks
-                if goal_lower in t.get("task", "").lower()
-                or goal_lower in t.get("category", "").lower()
-            ]
-            status = f"{len(related)} tasks completed" if related else "No tasks yet"
-            lines.append(f"| {goal['name']} | {goal['target']} | {status} |")
-        lines.append("")
+            related = sum(
+                1 for name, cat in task_index
+                if goal_lower in name or goal_lower in cat
+            )
+            status = f"{related} tasks completed" if related else "No tasks yet"
+            write(f"| {goal['name']} | {goal['target']} | {status} |\n")
+        write("\n")
     else:
-        lines.append("*No goals defined in Business_Goals.md.*\n")
+        write("*No goals defined in Business_Goals.md.*\n\n")
 
     # ── Bottlenecks ──
-    lines.extend([
-        "## Bottlenecks & Risks",
-        "",
-        "| # | Severity | Area | Issue | Impact |",
-        "|---|----------|------|-------|--------|",
-    ])
-    for i, bn in enumerate(sorted(bottlenecks, key=lambda b: {"HIGH": 0, "MEDIUM": 1, "LOW": 2}.get(b["severity"], 3)), 1):
-        sev_icon = {"HIGH": "RED", "MEDIUM": "YELLOW", "LOW": "BLUE"}.get(bn["severity"], "")
-        lines.append(
-            f"| {i} | {sev_icon} {bn['severity']} | {bn['area']} | {bn['issue']} | {bn['impact']} |"
-        )
-    lines.append("")
+    heading("Bottlenecks & Risks")
+    write(
+        "\n"
+        "| # | Severity | Area | Issue | Impact |\n"
+        "|---|----------|------|-------|--------|\n"
+    )
+    write("".join([
+        f"| {i} | {_SEV_ICONS_BY_CODE[bn['_sev']]} {bn['severity']} | {bn['area']} | {bn['issue']} | {bn['impact']} |\n"
+        for i, bn in enumerate(bottlenecks, 1)
+    ]))
+    write("\n")
 
     # ── Suggestions ──
-    lines.extend([
-        "## AI Suggestions",
-        "",
-        "| # | Category | Action | Potential Impact | Priority |",
-        "|---|----------|--------|-----------------|----------|",
-    ])
-    for i, sug in enumerate(sorted(suggestions, key=lambda s: {"HIGH": 0, "MEDIUM": 1, "LOW": 2}.get(s["priority"], 3)), 1):
-        lines.append(
-            f"| {i} | {sug['category']} | {sug['action']} | {sug['potential_savings']} | {sug['priority']} |"
-        )
-    lines.append("")
+    heading("AI Suggestions")
+    write(
+        "\n"
+        "| # | Category | Action | Potential Impact | Priority |\n"
+        "|---|----------|--------|-----------------|----------|\n"
+    )
+    write("".join([
+        f"| {i} | {sug['category']} | {sug['action']} | {sug['potential_savings']} | {sug['priority']} |\n"
+        for i, sug in enumerate(suggestions, 1)
+    ]))
+    write("\n")
 
     # ── Flagged Items ──
     if bank_data["flagged"]:
-        lines.extend([
-            "## Flagged Transactions (>$500)",
-            "",
-            "| Date | Description | Amount | Category |",
-            "|------|-------------|--------|----------|",
-        ])
-        for txn in bank_data["flagged"]:
-            lines.append(
-                f"| {txn['date']} | {txn['description']} | ${abs(txn['amount']):,.2f} | {txn['category']} |"
-            )
-        lines.extend([
-            "",
-            "*Per Company Handbook Rule #2: Payments >$500 require manual approval.*",
-            "",
-        ])
+        heading("Flagged Transactions (>$500)")
+        write(
+            "\n"
+            "| Date | Description | Amount | Category |\n"
+            "|------|-------------|--------|----------|\n"
+        )
+        write("".join([
+            f"| {txn['date']} | {txn['description']} | ${txn['amount_abs']:,.2f} | {txn['category']} |\n"
+            for txn in bank_data["flagged"]
+        ]))
+        write(
+            "\n"
+            "*Per Company Handbook Rule #2: Payments >$500 require manual approval.*\n"
+            "\n"
+        )
 
     # ── Footer ──
-    lines.extend([
-        "---",
-        "",
-        f"*Generated by AI Employee CEO Briefing System*",
-        f"*Data sources: Bank_Transactions.md, /Tasks/Done, Business_Goals.md*",
-        f"*Next briefing: {(now + timedelta(days=7)).strftime('%Y-%m-%d')} (Sunday cron)*",
-    ])
+    write(
+        "---\n"
+        "\n"
+        "*Generated by AI Employee CEO Briefing System*\n"
+        "*Data sources: Bank_Transactions.md, /Tasks/Done, Business_Goals.md*\n"
+        f"*Next briefing: {(now + timedelta(days=7)).strftime('%Y-%m-%d')} (Sunday cron)*"
+    )
+
+    if buf is not None:
+        return buf.getvalue()
+    return chars, lines
 
-    return "\n".join(lines)
+
+def _split_sections(text, offsets):
+    """Turn heading offsets into title -> text from that heading to the next.
+
+    Everything before the first heading (frontmatter and title) is stored
+    under "header".
+    """
+    starts = sorted(offsets.items(), key=operator.itemgetter(1))
+    if not starts:
+        return {"header": text}
+    ends = [pos for _, pos in starts[1:]] + [len(text)]
+    sections = {"header": text[:starts[0][1]]}
+    for (title, start), end in zip(starts, ends):
+        sections[title] = text[start:end]
+    return sections
 
 
 # ---------------------------------------------------------------------------
@@ -629,6 +896,7 @@ def generate_briefing(bank_data, tasks, goals, bottlenecks, suggestions, week_la
 # ---------------------------------------------------------------------------
 def run_briefing(week_label=None):
     """Full briefing pipeline — multi-step calculation with validation."""
+    _init_logging()
     logger.info("=" * 60)
     logger.info("CEO BRIEFING GENERATION — START")
     logger.info("=" * 60)
@@ -637,7 +905,7 @@ def run_briefing(week_label=None):
 
     # Step 1: Parse bank transactions
     logger.info("[1/6] Parsing Bank_Transactions.md...")
-    bank_data = parse_bank_transactions(BANK_FILE)
+    bank_data = load_cached(parse_bank_transactions, BANK_FILE)
     logger.info(
         f"  Balance: ${bank_data['balance']:,.2f} | "
         f"Income: ${bank_data['total_income']:,.2f} | "
@@ -648,12 +916,12 @@ def run_briefing(week_label=None):
 
     # Step 2: Parse completed tasks
     logger.info("[2/6] Parsing /Tasks/Done...")
-    tasks = parse_completed_tasks(TASKS_DONE_DIR)
+    tasks = load_cached(parse_completed_tasks, TASKS_DONE_DIR)
     logger.info(f"  {len(tasks)} completed tasks found")
 
     # Step 3: Parse goals
     logger.info("[3/6] Parsing Business_Goals.md...")
-    goals = parse_goals(GOALS_FILE)
+    goals = load_cached(parse_goals, GOALS_FILE)
     logger.info(f"  {len(goals['focus_areas'])} focus areas")
 
     # Step 4: Detect bottlenecks
@@ -669,9 +937,14 @@ def run_briefing(week_label=None):
 
     # Step 6: Assemble and write briefing
     logger.info("[6/6] Generating briefing document...")
-    briefing_md = generate_briefing(
-        bank_data, tasks, goals, bottlenecks, suggestions, week_label
+    buf = io.StringIO()
+    offsets = {}
+    size, line_count = generate_briefing(
+        bank_data, tasks, goals, bottlenecks, suggestions, week_label,
+        out=buf, sections=offsets,
     )
+    briefing_md = buf.getvalue()
+    sections = _split_sections(briefing_md, offsets)
 
     # Ensure directory exists
     BRIEFINGS_DIR.mkdir(parents=True, exist_ok=True)
@@ -679,20 +952,21 @@ def run_briefing(week_label=None):
     now = datetime.now()
     filename = f"Briefing_{now.strftime('%Y-%m-%d')}_{now.strftime('%H%M%S')}.md"
     filepath = BRIEFINGS_DIR / filename
-    filepath.write_text(briefing_md, encoding="utf-8")
+    with filepath.open("w", encoding="utf-8", buffering=65536) as f:
+        f.write(briefing_md)
 
     logger.info(f"  Briefing saved: {filepath}")
-    logger.info(f"  Size: {len(briefing_md)} chars, {briefing_md.count(chr(10))} lines")
+    logger.info(f"  Size: {size} chars, {line_count} lines")
 
     # Validation (Ralph Wiggum multi-step check)
     checks = {
         "has_frontmatter": briefing_md.startswith("---"),
-        "has_executive_summary": "Executive Summary" in briefing_md,
-        "has_financial_overview": "Financial Overview" in briefing_md,
-        "has_bottlenecks": "Bottlenecks" in briefing_md,
-        "has_suggestions": "AI Suggestions" in briefing_md,
-        "has_tasks": "Tasks Completed" in briefing_md,
-        "has_goals": "Goals Progress" in briefing_md,
+        "has_executive_summary": "Executive Summary" in sections,
+        "has_financial_overview": "Financial Overview" in sections,
+        "has_bottlenecks": "Bottlenecks & Risks" in sections,
+        "has_suggestions": "AI Suggestions" in sections,
+        "has_tasks": "Tasks Completed This Period" in sections,
+        "has_goals": "Goals Progress" in sections,
         "balance_parsed": bank_data["balance"] > 0 or not bank_data["transactions"],
         "file_written": filepath.exists(),
     }
@@ -712,6 +986,7 @@ def run_briefing(week_label=None):
         f"{'ALL CHECKS PASSED' if all_passed else 'SOME CHECKS FAILED'}"
     )
     logger.info("=" * 60)
+    _flush_logs()
 
     return {
         "filepath": str(filepath),
@@ -724,6 +999,7 @@ def run_briefing(week_label=None):
         "bottlenecks": bottlenecks,
         "suggestions": suggestions,
         "briefing_md": briefing_md,
+        "sections": sections,
         "errors": errors,
     }
 
@@ -760,24 +1036,46 @@ def setup_cron_schedule():
 # ---------------------------------------------------------------------------
 def run_tests():
     """Simulation test suite — iterate until all pass."""
+    _init_logging()
     MAX_ATTEMPTS = 3
     success = False
 
+    def load_inputs():
+        return (
+            load_cached(parse_bank_transactions, BANK_FILE),
+            load_cached(parse_completed_tasks, TASKS_DONE_DIR),
+            load_cached(parse_goals, GOALS_FILE),
+        )
+
+    def inputs_signature():
+        return tuple(
+            _source_signature(path) for path in (BANK_FILE, TASKS_DONE_DIR, GOALS_FILE)
+        )
+
+    # Parsed inputs come from the parse cache, so retries only re-read changed files
+    signature = inputs_signature()
+    bank, tasks, goals = load_inputs()
+
     for attempt in range(1, MAX_ATTEMPTS + 1):
         logger.info(f"\nRalph Wiggum Iteration #{attempt}")
+        if attempt > 1:
+            bank, tasks, goals = load_inputs()
 
         passed = 0
         failed = 0
         total = 0
+        retryable_failures = 0
 
-        def check(condition, name):
-            nonlocal passed, failed, total
+        def check(condition, name, retryable=False):
+            """retryable marks checks that depend on I/O and may pass on a rerun."""
+            nonlocal passed, failed, total, retryable_failures
             total += 1
             if condition:
                 passed += 1
                 logger.info(f"  PASS: {name}")
             else:
                 failed += 1
+                retryable_failures += retryable
                 logger.info(f"  FAIL: {name}")
 
         logger.info("=" * 60)
@@ -786,7 +1084,6 @@ def run_tests():
 
         # ── Test 1: Bank Transaction Parsing ──
         logger.info("\n[1/10] Bank Transaction Parsing")
-        bank = parse_bank_transactions(BANK_FILE)
         check(len(bank["transactions"]) > 0, f"Parsed {len(bank['transactions'])} transactions")
         check(bank["balance"] > 0, f"Balance: ${bank['balance']:,.2f}")
         check(bank["total_income"] > 0, f"Total income: ${bank['total_income']:,.2f}")
@@ -806,30 +1103,29 @@ def run_tests():
         # ── Test 3: Subscription Detection ──
         logger.info("\n[3/10] Subscription Detection")
         check(len(bank["subscriptions"]) >= 5, f"Found {len(bank['subscriptions'])} subscriptions")
-        sub_names = [s["description"] for s in bank["subscriptions"]]
-        check(any("AWS" in n for n in sub_names), "AWS subscription detected")
-        check(any("Slack" in n for n in sub_names), "Slack subscription detected")
+        # Needles never contain '\n', so one joined blob answers "any name contains"
+        sub_blob = "\n".join(s["description"] for s in bank["subscriptions"])
+        check("AWS" in sub_blob, "AWS subscription detected")
+        check("Slack" in sub_blob, "Slack subscription detected")
 
         # ── Test 4: Flagged Expenses ──
         logger.info("\n[4/10] Flagged Expenses (>$500)")
         check(len(bank["flagged"]) > 0, f"Found {len(bank['flagged'])} flagged items")
-        flagged_amts = [abs(f["amount"]) for f in bank["flagged"]]
-        check(all(a > EXPENSE_FLAG_THRESHOLD for a in flagged_amts), "All flagged > $500")
-        check(any("Office Supplies" in f["description"] for f in bank["flagged"]),
-              "Office Supplies #4821 ($750) flagged")
+        check(all(abs(f["amount"]) > EXPENSE_FLAG_THRESHOLD for f in bank["flagged"]),
+              "All flagged > $500")
+        flagged_blob = "\n".join(f["description"] for f in bank["flagged"])
+        check("Office Supplies" in flagged_blob, "Office Supplies #4821 ($750) flagged")
 
         # ── Test 5: Tasks Parsing ──
         logger.info("\n[5/10] Completed Tasks Parsing")
-        tasks = parse_completed_tasks(TASKS_DONE_DIR)
         check(len(tasks) >= 5, f"Found {len(tasks)} completed tasks")
-        task_names = [t["task"] for t in tasks]
-        check(any("Acme" in n for n in task_names), "Acme Corp task found")
-        check(any("Widget" in n for n in task_names), "Widget Inc task found")
-        check(any("payroll" in n.lower() for n in task_names), "Payroll task found")
+        task_blob = "\n".join(t["task"] for t in tasks)
+        check("Acme" in task_blob, "Acme Corp task found")
+        check("Widget" in task_blob, "Widget Inc task found")
+        check("payroll" in task_blob.lower(), "Payroll task found")
 
         # ── Test 6: Goals Parsing ──
         logger.info("\n[6/10] Goals Parsing")
-        goals = parse_goals(GOALS_FILE)
         check(len(goals["focus_areas"]) >= 3, f"Found {len(goals['focus_areas'])} focus areas")
         goal_names = [g["name"] for g in goals["focus_areas"]]
         check("Lead Generation" in goal_names, "Lead Generation goal found")
@@ -839,56 +1135,59 @@ def run_tests():
         logger.info("\n[7/10] Bottleneck Detection")
         bottlenecks = detect_bottlenecks(bank, tasks, goals)
         check(len(bottlenecks) > 0, f"Detected {len(bottlenecks)} bottlenecks")
-        bn_areas = [b["area"] for b in bottlenecks]
-        check(any("Burn Rate" in a or "Expense" in a for a in bn_areas),
-              "Financial bottleneck detected")
-        severities = [b["severity"] for b in bottlenecks]
+        bn_blob = "\n".join(b["area"] for b in bottlenecks)
+        check("Burn Rate" in bn_blob or "Expense" in bn_blob, "Financial bottleneck detected")
+        severities = {b["severity"] for b in bottlenecks}
         check("HIGH" in severities or "MEDIUM" in severities, "Severity levels assigned")
 
         # ── Test 8: Suggestion Generation ──
         logger.info("\n[8/10] Suggestion Generation")
         suggestions = generate_suggestions(bank, tasks, goals, bottlenecks)
         check(len(suggestions) > 0, f"Generated {len(suggestions)} suggestions")
-        sug_cats = [s["category"] for s in suggestions]
-        check(any("Revenue" in c or "Cost" in c or "Business" in c for c in sug_cats),
+        sug_blob = "\n".join(s["category"] for s in suggestions)
+        check("Revenue" in sug_blob or "Cost" in sug_blob or "Business" in sug_blob,
               "Actionable categories present")
         check(all("priority" in s for s in suggestions), "All suggestions have priority")
 
         # ── Test 9: Full Briefing Generation ──
         logger.info("\n[9/10] Full Briefing Generation")
         result = run_briefing(week_label="2026-W08-TEST")
-        check(result["all_passed"], "All internal validation checks passed")
+        check(result["all_passed"], "All internal validation checks passed", retryable=True)
         check(result["filepath"].endswith(".md"), "Briefing is .md file")
-        check(os.path.exists(result["filepath"]), "Briefing file exists on disk")
+        check(os.path.exists(result["filepath"]), "Briefing file exists on disk", retryable=True)
 
         md = result["briefing_md"]
+        sections = result["sections"]
         check(md.startswith("---"), "Has YAML frontmatter")
-        check("Executive Summary" in md, "Has Executive Summary section")
-        check("Financial Overview" in md, "Has Financial Overview section")
-        check("Revenue Breakdown" in md, "Has Revenue Breakdown table")
-        check("Expense Breakdown" in md, "Has Expense Breakdown table")
-        check("Active Subscriptions" in md, "Has Subscriptions section")
-        check("Tasks Completed" in md, "Has Tasks section")
-        check("Goals Progress" in md, "Has Goals section")
-        check("Bottlenecks" in md, "Has Bottlenecks section")
-        check("AI Suggestions" in md, "Has AI Suggestions section")
-        check("$500" in md, "References $500 threshold")
-        check("Company Handbook" in md, "References Company Handbook")
-        check("revenue_mtd: 28200" in md, "YAML has correct revenue")
-        check("balance: 26375" in md, "YAML has correct balance")
+        check("Executive Summary" in sections, "Has Executive Summary section")
+        check("Financial Overview" in sections, "Has Financial Overview section")
+        check("Revenue Breakdown" in sections, "Has Revenue Breakdown table")
+        check("Expense Breakdown by Category" in sections, "Has Expense Breakdown table")
+        check("Active Subscriptions" in sections, "Has Subscriptions section")
+        check("Tasks Completed This Period" in sections, "Has Tasks section")
+        check("Goals Progress" in sections, "Has Goals section")
+        check("Bottlenecks & Risks" in sections, "Has Bottlenecks section")
+        check("AI Suggestions" in sections, "Has AI Suggestions section")
+        # Content checks are scoped to the one section that should hold them
+        flagged_md = sections.get("Flagged Transactions (>$500)", "")
+        check("$500" in flagged_md, "References $500 threshold")
+        check("Company Handbook" in flagged_md, "References Company Handbook")
+        check("revenue_mtd: 28200" in sections["header"], "YAML has correct revenue")
+        check("balance: 26375" in sections["header"], "YAML has correct balance")
 
         # ── Test 10: Multi-Step Calculation Validation ──
         logger.info("\n[10/10] Multi-Step Calculation Validation")
-        net = bank["total_income"] - bank["total_expenses"]
+        # Aggregates were computed once at parse time (compute_aggregates)
+        net = bank["net"]
         check(abs(net - 1875.5) < 0.01, f"Net position: ${net:,.2f} = $1,875.50")
 
-        revenue_pct = bank["total_income"] / REVENUE_TARGET_MONTHLY * 100
+        revenue_pct = bank["revenue_pct"]
         check(abs(revenue_pct - 94.0) < 1, f"Revenue % of target: {revenue_pct:.0f}%")
 
-        expense_ratio = bank["total_expenses"] / bank["total_income"] * 100
+        expense_ratio = bank["expense_ratio"] or 0.0
         check(expense_ratio > 90, f"Expense ratio: {expense_ratio:.1f}% (triggers bottleneck)")
 
-        sub_total_all = sum(abs(s["amount"]) for s in bank["subscriptions"])
+        sub_total_all = bank["sub_total"]
         check(sub_total_all > 1500, f"Subscription total: ${sub_total_all:,.2f} (triggers warning)")
 
         # ── Results ──
@@ -900,18 +1199,27 @@ def run_tests():
             success = True
             break
 
+        # Apart from the file-write checks the suite is deterministic: retrying
+        # only helps if the vault changed or an I/O-dependent check failed
+        new_signature = inputs_signature()
+        if new_signature == signature and not retryable_failures:
+            logger.info("\nVault inputs unchanged and no retryable failures — not retrying.")
+            break
+        signature = new_signature
+
     if success:
         logger.info(f"\nAll tests passed!")
-        return True
     else:
-        logger.info(f"\nTests failing after {MAX_ATTEMPTS} attempts.")
-        return False
+        logger.info(f"\nTests failing after {attempt} attempts.")
+    _flush_logs()
+    return success
 
 
 # ---------------------------------------------------------------------------
 # CLI Entry Point
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    _init_logging()
     args = sys.argv[1:]
 
     if "--test" in args:
@@ -1,76 +1,225 @@
 import os
 import logging
-import base64
-from googleapiclient.discovery import build
-from google.oauth2.credentials import Credentials
-import yaml
+import sqlite3
+import json
+import time
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Globals
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
-PROCESSED_IDS_FILE = 'processed_ids.txt'
+PROCESSED_IDS_FILE = 'processed_ids.txt'  # legacy store, imported once into the db
+PROCESSED_IDS_DB = 'processed_ids.db'
+SERVICE_TTL = 3000  # seconds before token.json is re-read and the service rebuilt
+BATCH_SIZE = 50  # Gmail's recommended ceiling for one batch request
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
 NEEDS_ACTION_DIR = 'd:/hackathon0/hackathon/AI_Employee_Vault/Needs_Action'
 
 # Ensure the Needs_Action directory exists
 os.makedirs(NEEDS_ACTION_DIR, exist_ok=True)
 
-def load_processed_ids():
-    if not os.path.exists(PROCESSED_IDS_FILE):
-        return set()
-    with open(PROCESSED_IDS_FILE, 'r') as f:
-        return set(f.read().splitlines())
+_db = None
+
+def _get_db():
+    global _db
+    if _db is None:
+        _db = sqlite3.connect(PROCESSED_IDS_DB)
+        # WAL appends each poll's commit to one log file with a single sync
+        _db.execute('PRAGMA journal_mode=WAL')
+        _db.execute('PRAGMA synchronous=NORMAL')
+        _db.execute('CREATE TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY)')
+        _db.execute('CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)')
+        # Carry over ids recorded by the old text-file store
+        if os.path.exists(PROCESSED_IDS_FILE):
+            with open(PROCESSED_IDS_FILE, 'r') as f:
+                legacy = [(line,) for line in f.read().splitlines() if line]
+            _db.executemany('INSERT OR IGNORE INTO seen (id) VALUES (?)', legacy)
+            _db.commit()
+            os.replace(PROCESSED_IDS_FILE, PROCESSED_IDS_FILE + '.migrated')
+    return _db
+
+def filter_unprocessed(email_ids):
+    """Return the ids not yet recorded, in order, looking up only those ids."""
+    if not email_ids:
+        return []
+    seen = set()
+    db = _get_db()
+    for i in range(0, len(email_ids), 500):
+        chunk = email_ids[i:i + 500]
+        marks = ','.join('?' * len(chunk))
+        seen.update(row[0] for row in db.execute(f'SELECT id FROM seen WHERE id IN ({marks})', chunk))
+    return [i for i in email_ids if i not in seen]
+
+def save_processed_ids(email_ids):
+    if not email_ids:
+        return
+    db = _get_db()
+    db.executemany('INSERT OR IGNORE INTO seen (id) VALUES (?)', [(i,) for i in email_ids])
+    db.commit()
+
+def load_history_id():
+    row = _get_db().execute("SELECT value FROM state WHERE key = 'history_id'").fetchone()
+    return row[0] if row else None
+
+def save_history_id(history_id):
+    db = _get_db()
+    db.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('history_id', ?)", (str(history_id),))
+    db.commit()
+
+def list_new_message_ids(service):
+    """Return (message ids to consider, historyId to resume from next poll).
+
+    Uses the history API to fetch only what was added since the last poll; falls
+    back to listing unread+important mail when there is no stored historyId or
+    Gmail has expired it (404).
+    """
+    from googleapiclient.errors import HttpError
+
+    start = load_history_id()
+    if start:
+        try:
+            ids = []
+            page_token = None
+            while True:
+                resp = service.users().history().list(
+                    userId='me', startHistoryId=start, historyTypes=['messageAdded'],
+                    labelId='IMPORTANT', pageToken=page_token
+                ).execute()
+                for record in resp.get('history', []):
+                    for added in record.get('messagesAdded', []):
+                        msg = added['message']
+                        if 'UNREAD' in msg.get('labelIds', []):
+                            ids.append(msg['id'])
+                page_token = resp.get('nextPageToken')
+                if not page_token:
+                    break
+            return list(dict.fromkeys(ids)), resp['historyId']
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            logging.warning("Stored Gmail historyId expired; falling back to a full listing")
+
+    # Take the historyId before listing so nothing arriving in between is missed
+    history_id = service.users().getProfile(userId='me').execute()['historyId']
+    results = service.users().messages().list(userId='me', labelIds=['UNREAD', 'IMPORTANT'], maxResults=10).execute()
+    return [m['id'] for m in results.get('messages', [])], history_id
+
+_PLAIN_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _.,@<>()/+-')
+_YAML_KEYWORDS = {'', 'null', '~', 'true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n'}
 
-def save_processed_id(email_id):
-    with open(PROCESSED_IDS_FILE, 'a') as f:
-        f.write(email_id + '\n')
+def _yaml_scalar(value):
+    """Emit a string as a YAML scalar: plain when unambiguous, else double-quoted."""
+    # Starting with a letter rules out numbers, dates and YAML indicators
+    if (value[:1].isalpha() and value[-1:] != ' ' and value.lower() not in _YAML_KEYWORDS
+            and all(c in _PLAIN_CHARS for c in value)):
+        return value
+    # JSON strings are valid YAML double-quoted scalars
+    return json.dumps(value, ensure_ascii=False)
 
 def create_markdown_file(email_data):
     file_name = f"{email_data['id']}.md"
     file_path = os.path.join(NEEDS_ACTION_DIR, file_name)
     
-    yaml_frontmatter = {
-        'type': 'email',
-        'from': email_data['from'],
-        'subject': email_data['subject'],
-        'priority': 'high'
-    }
-
-    content = f"---\n{yaml.dump(yaml_frontmatter)}---\n\n{email_data['snippet']}"
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Fixed four-key frontmatter, written directly rather than through yaml.dump
+    content = (
+        "---\n"
+        "type: email\n"
+        f"from: {_yaml_scalar(email_data['from'])}\n"
+        f"subject: {_yaml_scalar(email_data['subject'])}\n"
+        "priority: high\n"
+        f"---\n\n{email_data['snippet']}"
+    )
+
+    # Encode once and write through a raw fd, skipping the text/buffered IO layers
+    payload = memoryview(content.encode('utf-8'))
+    fd = os.open(file_path, _WRITE_FLAGS, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
 
     logging.info(f"Created markdown file: {file_path}")
 
-def fetch_unread_emails():
-    creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-    service = build('gmail', 'v1', credentials=creds)
-
-    results = service.users().messages().list(userId='me', labelIds=['UNREAD', 'IMPORTANT'], maxResults=10).execute()
-    messages = results.get('messages', [])
+_service = None
+_service_expires = 0.0
 
-    processed_ids = load_processed_ids()
+def get_service():
+    """Return the Gmail service, building it at most once per SERVICE_TTL."""
+    global _service, _service_expires
+    now = time.monotonic()
+    if _service is None or now >= _service_expires:
+        # Google client imports are deferred so importing this module stays cheap
+        from googleapiclient.discovery import build
+        from google.oauth2.credentials import Credentials
 
-    for message in messages:
-        msg_id = message['id']
-        if msg_id in processed_ids:
-            continue
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+        # Use the discovery document bundled with google-api-python-client rather than fetching it
+        _service = build('gmail', 'v1', credentials=creds, static_discovery=True, cache_discovery=False)
+        _service_expires = now + SERVICE_TTL
+    return _service
 
-        msg = service.users().messages().get(userId='me', id=msg_id).execute()
-        headers = {header['name']: header['value'] for header in msg['payload']['headers']}
+def fetch_unread_emails():
+    service = get_service()
+
+    candidate_ids, history_id = list_new_message_ids(service)
+    new_ids = []
+    failed_ids = []
+
+    def on_message(request_id, msg, exception):
+        if exception is not None:
+            logging.error(f"Failed to fetch message {request_id}: {exception}")
+            failed_ids.append(request_id)
+            return
+
+        msg_id = msg['id']
+        # Pick out just From/Subject, stopping once both are found
+        sender = subject = None
+        for header in msg['payload']['headers']:
+            name = header['name']
+            if name == 'From':
+                if sender is None:
+                    sender = header['value']
+            elif name == 'Subject':
+                if subject is None:
+                    subject = header['value']
+            else:
+                continue
+            if sender is not None and subject is not None:
+                break
         snippet = msg.get('snippet', '')
 
         email_data = {
             'id': msg_id,
-            'from': headers.get('From', 'Unknown'),
-            'subject': headers.get('Subject', 'No Subject'),
+            'from': sender if sender is not None else 'Unknown',
+            'subject': subject if subject is not None else 'No Subject',
             'snippet': snippet
         }
 
         create_markdown_file(email_data)
-        save_processed_id(msg_id)
+        new_ids.append(msg_id)
+
+    # Fetch new messages in batched HTTP requests instead of one round-trip each.
+    # Only headers and the snippet are used, so skip downloading message bodies.
+    to_fetch = filter_unprocessed(candidate_ids)
+    for start in range(0, len(to_fetch), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=on_message)
+        for msg_id in to_fetch[start:start + BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(
+                    userId='me', id=msg_id, format='metadata',
+                    metadataHeaders=['From', 'Subject']
+                ),
+                request_id=msg_id
+            )
+        batch.execute()
+
+    # Record the whole poll with one commit. The history cursor only moves forward
+    # once every message was fetched, so failures are picked up again next poll.
+    save_processed_ids(new_ids)
+    if not failed_ids:
+        save_history_id(history_id)
 
 def main():
     try:
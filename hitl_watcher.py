@@ -27,6 +27,7 @@ YAML Frontmatter Schema:
 
 Usage:
   python hitl_watcher.py                  # Run watcher loop
+  python hitl_watcher.py --poll           # Run polling loop (NFS/CIFS mounts)
   python hitl_watcher.py --once           # Single scan
   python hitl_watcher.py --simulate       # E2E simulation test
 """
@@ -36,16 +37,36 @@ import sys
 import re
 import json
 import time
+import queue
+import atexit
 import shutil
+import secrets
 import logging
 import argparse
-import hashlib
-from datetime import datetime, timedelta, timezone
+import threading
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
+try:
+    from watchfiles import watch, Change
+except ImportError:
+    watch = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -61,6 +82,8 @@ HITL_STATE_FILE = VAULT_DIR / ".hitl_state.json"
 
 EXPIRY_HOURS = 24
 POLL_INTERVAL = 10  # seconds
+HOUSEKEEPING_INTERVAL = 600  # seconds between expiry sweeps in watch mode
+MAX_EXECUTED_IDS = 10_000  # oldest executed ids are forgotten beyond this
 
 # Ensure directories
 for d in [PENDING_DIR, APPROVED_DIR, REJECTED_DIR, EXPIRED_DIR, DONE_DIR]:
@@ -72,42 +95,109 @@ for d in [PENDING_DIR, APPROVED_DIR, REJECTED_DIR, EXPIRED_DIR, DONE_DIR]:
 log_formatter = logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s")
 file_handler = logging.FileHandler(str(HITL_LOG_FILE), encoding="utf-8")
 file_handler.setFormatter(log_formatter)
-console_stream = open(sys.stdout.fileno(), mode='w', encoding='utf-8', closefd=False) if sys.platform == 'win32' else sys.stdout
-console_handler = logging.StreamHandler(console_stream)
+if sys.platform == 'win32' and hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding="utf-8")
+console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setFormatter(log_formatter)
 
+# Handlers run on a listener thread; callers only enqueue the record
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, file_handler, console_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logger = logging.getLogger("hitl")
 logger.setLevel(logging.INFO)
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+logger.addHandler(QueueHandler(log_queue))
 
 
 # ---------------------------------------------------------------------------
 # HITL Action File Parser
 # ---------------------------------------------------------------------------
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z][\w-]*\Z")
+_YAML_KEYWORDS = {"y", "n", "yes", "no", "on", "off", "true", "false", "null"}
+
+
+def _yaml_scalar(value: str) -> str:
+    """Render a string as a YAML scalar: bare when unambiguous, else double-quoted."""
+    if _PLAIN_SCALAR_RE.match(value) and value.lower() not in _YAML_KEYWORDS:
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode(data: bytes) -> str:
+    """Decode UTF-8 file bytes with the same newline handling as read_text."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _atomic_write(path: Path, *chunks: str):
+    """Stream chunks to a sibling temp file, then swap it into place."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fp:
+        for chunk in chunks:
+            fp.write(chunk.encode("utf-8"))
+    os.replace(tmp, path)
+
+
+def _coerce_dt(val) -> Optional[datetime]:
+    """Accept a YAML datetime or an ISO 8601 string; anything else is None."""
+    if isinstance(val, datetime):
+        return val
+    if isinstance(val, str):
+        try:
+            return datetime.fromisoformat(val)
+        except ValueError:
+            return None
+    return None
+
+
 class HITLAction:
     """Represents a single HITL approval action file."""
 
+    _READ_CHUNK = 8192
+
     def __init__(self, file_path: Path):
         self.file_path = file_path
         self.meta = {}
-        self.body = ""
+        self._body: Optional[str] = None
+        self._body_offset = 0
+        self._strip_body = False
         self._parse()
+        self._refresh_dates()
 
     def _parse(self):
-        raw = self.file_path.read_text(encoding="utf-8")
-        if raw.startswith("---"):
-            parts = raw.split("---", 2)
-            if len(parts) >= 3:
-                try:
-                    self.meta = yaml.safe_load(parts[1]) or {}
-                except yaml.YAMLError:
-                    self.meta = {}
-                self.body = parts[2].strip()
-            else:
-                self.body = raw
-        else:
-            self.body = raw
+        """Read only as far as the closing '---'; the body is loaded on first access."""
+        with open(self.file_path, "rb") as fp:
+            head = bytearray(fp.read(self._READ_CHUNK))
+            if not head.startswith(b"---"):
+                return
+            end = head.find(b"---", 3)
+            while end == -1:
+                chunk = fp.read(self._READ_CHUNK)
+                if not chunk:
+                    return
+                start = max(3, len(head) - 2)
+                head += chunk
+                end = head.find(b"---", start)
+        try:
+            self.meta = yaml.load(_decode(bytes(head[3:end])), Loader=_YLoader) or {}
+        except (yaml.YAMLError, UnicodeDecodeError):
+            self.meta = {}
+        self._body_offset = end + 3
+        self._strip_body = True
+
+    @property
+    def body(self) -> str:
+        if self._body is None:
+            with open(self.file_path, "rb") as fp:
+                fp.seek(self._body_offset)
+                text = _decode(fp.read())
+            self._body = text.strip() if self._strip_body else text
+        return self._body
+
+    @body.setter
+    def body(self, value: str):
+        self._body = value
 
     @property
     def id(self) -> str:
@@ -125,43 +215,39 @@ class HITLAction:
     def priority(self) -> str:
         return self.meta.get("priority", "normal")
 
+    def _refresh_dates(self):
+        """Parse created/expires once; call again whenever they change in meta."""
+        self._created = _coerce_dt(self.meta.get("created"))
+        self._expires = _coerce_dt(self.meta.get("expires"))
+        # Deadline as a float so expiry checks are a plain comparison
+        try:
+            exp = self._expires
+            if exp is None and self._created:
+                exp = self._created + timedelta(hours=EXPIRY_HOURS)
+            self._expires_ts = exp.replace(tzinfo=None).timestamp() if exp else None
+        except Exception:
+            self._expires_ts = None
+
     @property
     def created(self) -> Optional[datetime]:
-        val = self.meta.get("created")
-        if isinstance(val, datetime):
-            return val
-        if isinstance(val, str):
-            try:
-                return datetime.fromisoformat(val)
-            except ValueError:
-                return None
-        return None
+        return self._created
 
     @property
     def expires(self) -> Optional[datetime]:
-        val = self.meta.get("expires")
-        if isinstance(val, datetime):
-            return val
-        if isinstance(val, str):
-            try:
-                return datetime.fromisoformat(val)
-            except ValueError:
-                return None
-        return None
+        return self._expires
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Expiry deadline as a POSIX timestamp, or None if it can't be determined."""
+        return self._expires_ts
 
     @property
     def is_expired(self) -> bool:
-        now = datetime.now()
-        try:
-            if self.expires:
-                exp = self.expires.replace(tzinfo=None) if self.expires.tzinfo else self.expires
-                return now > exp
-            if self.created:
-                crt = self.created.replace(tzinfo=None) if self.created.tzinfo else self.created
-                return now > crt + timedelta(hours=EXPIRY_HOURS)
-        except Exception:
-            return False
-        return False
+        return self.is_expired_at(time.time())
+
+    def is_expired_at(self, now: float) -> bool:
+        """Expiry check against a caller-supplied clock, so a scan can share one `now`."""
+        return self._expires_ts is not None and now > self._expires_ts
 
     @property
     def amount(self) -> Optional[float]:
@@ -174,26 +260,45 @@ class HITLAction:
         return None
 
     def update_status(self, new_status: str):
-        self.meta["status"] = new_status
-        self._write()
+        self._patch_frontmatter_line("status", new_status)
 
     def add_execution_log(self, result: str):
-        self.meta["executed_at"] = datetime.now().isoformat()
-        self.meta["execution_result"] = result
-        self._write()
+        self._patch_frontmatter_line("executed_at", datetime.now().isoformat())
+        self._patch_frontmatter_line("execution_result", result)
+
+    def _patch_frontmatter_line(self, key: str, value: str):
+        """Rewrite (or append) one top-level frontmatter key without re-dumping the YAML."""
+        self.meta[key] = value
+        if key in ("created", "expires"):
+            self._refresh_dates()
+        raw = self.file_path.read_text(encoding="utf-8")
+        end = raw.find("\n---", 3) if raw.startswith("---\n") else -1
+        if end == -1:
+            self._write()
+            return
+        if self._body is None:
+            # The patch below shifts the body, so capture it while we have the text
+            self._body = raw[end + 4:].strip()
+        head = raw[:end + 1]
+        line = f"{key}: {_yaml_scalar(value)}"
+        # The key line plus any indented continuation lines of a folded value
+        pattern = re.compile(rf"^{re.escape(key)}:.*(?:\n[ \t]+.*)*$", re.M)
+        head, found = pattern.subn(lambda _: line, head, count=1)
+        if not found:
+            head += line + "\n"
+        _atomic_write(self.file_path, head, raw[end + 1:])
 
     def _write(self):
-        frontmatter = yaml.dump(self.meta, default_flow_style=False, allow_unicode=True)
-        content = f"---\n{frontmatter}---\n\n{self.body}"
-        self.file_path.write_text(content, encoding="utf-8")
+        self._refresh_dates()
+        frontmatter = yaml.dump(self.meta, Dumper=_YDumper, default_flow_style=False, allow_unicode=True)
+        _atomic_write(self.file_path, "---\n", frontmatter, "---\n\n", self.body)
 
 
 # ---------------------------------------------------------------------------
 # Action ID Generator
 # ---------------------------------------------------------------------------
 def generate_action_id(prefix: str = "hitl") -> str:
-    import secrets
-    return f"{prefix}_{int(datetime.now().timestamp())}_{secrets.token_hex(3)}"
+    return f"{prefix}_{int(time.time())}_{secrets.token_hex(3)}"
 
 
 # ---------------------------------------------------------------------------
@@ -226,9 +331,8 @@ class HITLTemplates:
         }
 
         file_path = PENDING_DIR / f"{action_id}.md"
-        frontmatter = yaml.dump(meta, default_flow_style=False, allow_unicode=True)
-        content = f"---\n{frontmatter}---\n\n{body}"
-        file_path.write_text(content, encoding="utf-8")
+        frontmatter = yaml.dump(meta, Dumper=_YDumper, default_flow_style=False, allow_unicode=True)
+        _atomic_write(file_path, "---\n", frontmatter, "---\n\n", body)
         logger.info(f"Created email action: {action_id} -> {to}")
         return file_path
 
@@ -290,9 +394,8 @@ class HITLTemplates:
         ])
 
         file_path = PENDING_DIR / f"{action_id}.md"
-        frontmatter = yaml.dump(meta, default_flow_style=False, allow_unicode=True)
-        content = f"---\n{frontmatter}---\n\n" + "\n".join(body_lines)
-        file_path.write_text(content, encoding="utf-8")
+        frontmatter = yaml.dump(meta, Dumper=_YDumper, default_flow_style=False, allow_unicode=True)
+        _atomic_write(file_path, "---\n", frontmatter, "---\n\n", "\n".join(body_lines))
         logger.info(f"Created payment action: {action_id} -> {to} ({currency} {amount:,.2f})")
         return file_path
 
@@ -319,9 +422,8 @@ class HITLTemplates:
         }
 
         file_path = PENDING_DIR / f"{action_id}.md"
-        frontmatter = yaml.dump(meta, default_flow_style=False, allow_unicode=True)
-        content = f"---\n{frontmatter}---\n\n{post_text}"
-        file_path.write_text(content, encoding="utf-8")
+        frontmatter = yaml.dump(meta, Dumper=_YDumper, default_flow_style=False, allow_unicode=True)
+        _atomic_write(file_path, "---\n", frontmatter, "---\n\n", post_text)
         logger.info(f"Created LinkedIn action: {action_id}")
         return file_path
 
@@ -348,9 +450,8 @@ class HITLTemplates:
         }
 
         file_path = PENDING_DIR / f"{action_id}.md"
-        frontmatter = yaml.dump(meta, default_flow_style=False, allow_unicode=True)
-        content = f"---\n{frontmatter}---\n\n{message}"
-        file_path.write_text(content, encoding="utf-8")
+        frontmatter = yaml.dump(meta, Dumper=_YDumper, default_flow_style=False, allow_unicode=True)
+        _atomic_write(file_path, "---\n", frontmatter, "---\n\n", message)
         logger.info(f"Created WhatsApp action: {action_id} -> {to}")
         return file_path
 
@@ -376,9 +477,8 @@ class HITLTemplates:
         }
 
         file_path = PENDING_DIR / f"{action_id}.md"
-        frontmatter = yaml.dump(meta, default_flow_style=False, allow_unicode=True)
-        content = f"---\n{frontmatter}---\n\n## {title}\n\n{body}"
-        file_path.write_text(content, encoding="utf-8")
+        frontmatter = yaml.dump(meta, Dumper=_YDumper, default_flow_style=False, allow_unicode=True)
+        _atomic_write(file_path, "---\n", frontmatter, "---\n\n", f"## {title}\n\n", body)
         logger.info(f"Created general action: {action_id} — {title}")
         return file_path
 
@@ -391,15 +491,7 @@ class ActionExecutor:
 
     @staticmethod
     def execute(action: HITLAction) -> dict:
-        executor_map = {
-            "email": ActionExecutor._execute_email,
-            "payment": ActionExecutor._execute_payment,
-            "linkedin_post": ActionExecutor._execute_linkedin,
-            "whatsapp": ActionExecutor._execute_whatsapp,
-            "general": ActionExecutor._execute_general,
-        }
-
-        executor = executor_map.get(action.action, ActionExecutor._execute_general)
+        executor = ActionExecutor._EXECUTORS.get(action.action, ActionExecutor._execute_general)
         return executor(action)
 
     @staticmethod
@@ -467,10 +559,22 @@ class ActionExecutor:
             "message": f"Task '{title}' completed (simulated)",
         }
 
+    # Built once; staticmethod objects are unwrapped to plain functions
+    _EXECUTORS: ClassVar[dict] = {
+        "email": _execute_email.__func__,
+        "payment": _execute_payment.__func__,
+        "linkedin_post": _execute_linkedin.__func__,
+        "whatsapp": _execute_whatsapp.__func__,
+        "general": _execute_general.__func__,
+    }
+
 
 # ---------------------------------------------------------------------------
 # Claude Reasoning Integration
 # ---------------------------------------------------------------------------
+_IMPOLITE_RE = re.compile(r"stupid|idiot|useless|terrible|worst", re.IGNORECASE)
+
+
 def claude_reason_about_action(action: HITLAction) -> str:
     """
     Generate Claude's reasoning about whether an action should be approved.
@@ -490,9 +594,7 @@ def claude_reason_about_action(action: HITLAction) -> str:
 
     # Check WhatsApp politeness
     if action.action == "whatsapp":
-        impolite = ["stupid", "idiot", "useless", "terrible", "worst"]
-        body_lower = action.body.lower()
-        if any(w in body_lower for w in impolite):
+        if _IMPOLITE_RE.search(action.body):
             warnings.append("Message tone may violate Handbook Rule #1 (be polite on WhatsApp)")
         else:
             reasons.append("Message tone verified as polite (Handbook Rule #1)")
@@ -511,139 +613,222 @@ def claude_reason_about_action(action: HITLAction) -> str:
             warnings.append(f"Pre-existing flag: {flag}")
 
     # Build reasoning
-    reasoning = f"## Claude Reasoning for {action.id}\n\n"
-    reasoning += f"**Action:** {action.action} | **Priority:** {action.priority}\n\n"
+    parts = [
+        f"## Claude Reasoning for {action.id}\n\n",
+        f"**Action:** {action.action} | **Priority:** {action.priority}\n\n",
+    ]
 
     if reasons:
-        reasoning += "### Approval Factors\n"
-        for r in reasons:
-            reasoning += f"- ✅ {r}\n"
-        reasoning += "\n"
+        parts.append("### Approval Factors\n")
+        parts.extend(f"- ✅ {r}\n" for r in reasons)
+        parts.append("\n")
 
     if warnings:
-        reasoning += "### Warnings\n"
-        for w in warnings:
-            reasoning += f"- ⚠️ {w}\n"
-        reasoning += "\n"
-
-    if warnings:
-        reasoning += "**Recommendation:** Review carefully before approving.\n"
+        parts.append("### Warnings\n")
+        parts.extend(f"- ⚠️ {w}\n" for w in warnings)
+        parts.append("\n")
+        parts.append("**Recommendation:** Review carefully before approving.\n")
     else:
-        reasoning += "**Recommendation:** Safe to approve.\n"
+        parts.append("**Recommendation:** Safe to approve.\n")
 
-    return reasoning
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
 # HITL Watcher — Main Folder Monitor
 # ---------------------------------------------------------------------------
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _md_entries(directory: Path):
+    """Yield DirEntry objects for the regular .md files in a directory."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
 class HITLWatcher:
     """Watches /Approved for newly approved files and executes them."""
 
     def __init__(self):
         self.state = self._load_state()
+        # Insertion-ordered for O(1) lookups and oldest-first eviction
+        self._executed_ids = OrderedDict.fromkeys(self.state.get("executed_ids", []))
+        self._state_dirty = False
         self.stats = {
             "scans": 0,
             "approved_executed": 0,
             "expired": 0,
             "errors": [],
         }
+        # str(path) -> (st_mtime_ns, st_size, HITLAction, expires_at)
+        self._action_cache: dict = {}
+
+    def _load_action(self, f: Path, st: Optional[os.stat_result] = None) -> HITLAction:
+        """Return a parsed HITLAction, re-parsing only when the file changed."""
+        if st is None:
+            st = f.stat()
+        key = str(f)
+        cached = self._action_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        action = HITLAction(f)
+        self._action_cache[key] = (st.st_mtime_ns, st.st_size, action, action.expires_at)
+        return action
 
     def _load_state(self) -> dict:
         if HITL_STATE_FILE.exists():
             try:
-                return json.loads(HITL_STATE_FILE.read_text(encoding="utf-8"))
+                return _loads(HITL_STATE_FILE.read_bytes())
             except Exception:
                 pass
         return {"executed_ids": [], "last_scan": None}
 
     def _save_state(self):
+        """Persist state, but only if something changed since the last write."""
+        if not self._state_dirty:
+            return
         self.state["last_scan"] = datetime.now().isoformat()
-        HITL_STATE_FILE.write_text(json.dumps(self.state, indent=2), encoding="utf-8")
+        self.state["executed_ids"] = list(self._executed_ids)
+        HITL_STATE_FILE.write_bytes(_dumps(self.state))
+        self._state_dirty = False
 
     def scan_and_process(self) -> dict:
         """Single scan: check expiry, process approved, return stats."""
         self.stats["scans"] += 1
         cycle_stats = {"expired": 0, "executed": 0, "pending": 0, "errors": []}
 
-        # Step 1: Expire stale pending items
-        cycle_stats["expired"] = self._expire_stale()
+        # Step 1: Expire stale pending items and count the rest (one walk)
+        cycle_stats["expired"], cycle_stats["pending"] = self._sweep_pending()
 
         # Step 2: Process approved items
         executed, errors = self._process_approved()
         cycle_stats["executed"] = executed
         cycle_stats["errors"] = errors
 
-        # Step 3: Count pending
-        pending = [f for f in PENDING_DIR.iterdir() if f.suffix == ".md"]
-        cycle_stats["pending"] = len(pending)
-
         self._save_state()
         return cycle_stats
 
-    def _expire_stale(self) -> int:
-        """Move expired pending items to /Expired."""
+    def _sweep_pending(self) -> tuple:
+        """Move expired pending items to /Expired; return (expired, still pending)."""
         expired_count = 0
-        for f in PENDING_DIR.iterdir():
-            if f.suffix != ".md":
+        pending_count = 0
+        seen = set()
+        now = time.time()
+        for entry in _md_entries(PENDING_DIR):
+            seen.add(entry.path)
+            st = entry.stat()
+            # Fast path: unchanged file whose known deadline is still ahead
+            cached = self._action_cache.get(entry.path)
+            if (cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size
+                    and cached[3] is not None and now < cached[3]):
+                pending_count += 1
                 continue
-            try:
-                action = HITLAction(f)
-                if action.is_expired:
-                    action.update_status("expired")
-                    dest = EXPIRED_DIR / f.name
-                    shutil.move(str(f), str(dest))
-                    logger.warning(f"EXPIRED: {action.id} moved to /Expired")
-                    expired_count += 1
-            except Exception as e:
-                logger.error(f"Error checking expiry for {f.name}: {e}")
-        self.stats["expired"] += expired_count
-        return expired_count
+            if self._expire_one(Path(entry.path), st, now):
+                expired_count += 1
+            else:
+                pending_count += 1
+        # Forget files that left /Pending_Approval by hand; the cache also
+        # holds /Approved entries, which this walk never sees
+        pending_dir = str(PENDING_DIR)
+        for key in [k for k in self._action_cache
+                    if k not in seen and os.path.dirname(k) == pending_dir]:
+            del self._action_cache[key]
+        return expired_count, pending_count
+
+    def _expire_one(self, f: Path, st: Optional[os.stat_result] = None,
+                    now: Optional[float] = None) -> bool:
+        """Move a single pending item to /Expired if it is stale."""
+        try:
+            action = self._load_action(f, st)
+            if action.is_expired_at(time.time() if now is None else now):
+                action.update_status("expired")
+                dest = EXPIRED_DIR / f.name
+                os.replace(f, dest)
+                self._action_cache.pop(str(f), None)
+                self._state_dirty = True
+                logger.warning(f"EXPIRED: {action.id} moved to /Expired")
+                self.stats["expired"] += 1
+                return True
+        except Exception as e:
+            logger.error(f"Error checking expiry for {f.name}: {e}")
+        return False
 
     def _process_approved(self) -> tuple:
         """Execute approved actions and move to /Done."""
         executed = 0
         errors = []
+        seen = set()
 
-        for f in APPROVED_DIR.iterdir():
-            if f.suffix != ".md":
-                continue
+        for entry in _md_entries(APPROVED_DIR):
+            seen.add(entry.path)
+            f = Path(entry.path)
             try:
-                action = HITLAction(f)
-
-                if action.id in self.state.get("executed_ids", []):
-                    continue  # Already executed
-
-                # Add Claude reasoning
-                reasoning = claude_reason_about_action(action)
-                logger.info(f"Claude reasoning for {action.id}:\n{reasoning}")
-
-                # Execute
-                result = ActionExecutor.execute(action)
-                logger.info(f"Execution result: {json.dumps(result)}")
-
-                # Update file
-                action.update_status("executed")
-                action.add_execution_log(json.dumps(result))
-
-                # Move to Done
-                dest = DONE_DIR / f.name
-                shutil.move(str(f), str(dest))
-                logger.info(f"EXECUTED: {action.id} -> /Done")
-
-                self.state.setdefault("executed_ids", []).append(action.id)
-                executed += 1
-                self.stats["approved_executed"] += 1
-
+                if self._process_one(f, entry.stat()):
+                    executed += 1
             except Exception as e:
                 logger.error(f"Error executing {f.name}: {e}")
                 errors.append(f"{f.name}: {str(e)}")
                 self.stats["errors"].append(str(e))
 
+        approved_dir = str(APPROVED_DIR)
+        for key in [k for k in self._action_cache
+                    if k not in seen and os.path.dirname(k) == approved_dir]:
+            del self._action_cache[key]
         return executed, errors
 
-    def run_loop(self, interval: int = POLL_INTERVAL):
-        """Continuous monitoring loop."""
+    def _process_one(self, f: Path, st: Optional[os.stat_result] = None) -> bool:
+        """Execute a single approved action and move it to /Done."""
+        action = self._load_action(f, st)
+
+        if action.id in self._executed_ids:
+            return False  # Already executed
+
+        # Add Claude reasoning
+        reasoning = claude_reason_about_action(action)
+        logger.info(f"Claude reasoning for {action.id}:\n{reasoning}")
+
+        # Execute
+        result = ActionExecutor.execute(action)
+        logger.info(f"Execution result: {json.dumps(result)}")
+
+        # Update file
+        action.update_status("executed")
+        action.add_execution_log(json.dumps(result))
+
+        # Move to Done
+        dest = DONE_DIR / f.name
+        os.replace(f, dest)
+        self._action_cache.pop(str(f), None)
+        logger.info(f"EXECUTED: {action.id} -> /Done")
+
+        self._executed_ids[action.id] = None
+        if len(self._executed_ids) > MAX_EXECUTED_IDS:
+            self._executed_ids.popitem(last=False)
+        self._state_dirty = True
+        self.stats["approved_executed"] += 1
+        return True
+
+    def run_loop(self, interval: int = POLL_INTERVAL, poll: bool = False):
+        """Continuous monitoring loop (file events, or polling as fallback)."""
+        if poll or watch is None:
+            if not poll:
+                logger.warning("watchfiles not installed — falling back to polling")
+            self._poll_loop(interval)
+        else:
+            self._watch_loop()
+
+    def _poll_loop(self, interval: int):
         logger.info(f"HITL Watcher started (poll every {interval}s)")
         while True:
             try:
@@ -659,6 +844,60 @@ class HITLWatcher:
                 logger.error(f"Scan error: {e}")
             time.sleep(interval)
 
+    def _watch_loop(self):
+        """
+        Block on OS file events for /Approved and /Pending_Approval and handle
+        only the paths that changed. Expiry is time-based rather than
+        event-based, so a housekeeping thread still sweeps /Pending_Approval
+        (and retries anything left in /Approved) every HOUSEKEEPING_INTERVAL
+        seconds.
+        """
+        logger.info(f"HITL Watcher started (file events, expiry sweep every {HOUSEKEEPING_INTERVAL}s)")
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def housekeeping():
+            while not stop.wait(HOUSEKEEPING_INTERVAL):
+                try:
+                    with lock:
+                        expired, _ = self._sweep_pending()
+                        # Retry approvals whose execution failed earlier
+                        executed, _ = self._process_approved()
+                        self._save_state()
+                    if expired or executed:
+                        logger.info(f"Housekeeping: expired={expired}, executed={executed}")
+                except Exception as e:
+                    logger.error(f"Housekeeping error: {e}")
+
+        # Catch up on anything that arrived while the watcher was down
+        with lock:
+            self.scan_and_process()
+        threading.Thread(target=housekeeping, name="hitl-housekeeping", daemon=True).start()
+
+        try:
+            for changes in watch(APPROVED_DIR, PENDING_DIR, stop_event=stop, rust_timeout=5000):
+                with lock:
+                    for change, path in changes:
+                        if not path.endswith(".md"):
+                            continue
+                        if change == Change.deleted:
+                            self._action_cache.pop(path, None)
+                            continue
+                        f = Path(path)
+                        if not f.is_file():
+                            continue
+                        try:
+                            if f.parent.name == APPROVED_DIR.name:
+                                self._process_one(f)
+                            else:
+                                self._expire_one(f)
+                        except Exception as e:
+                            logger.error(f"Error executing {f.name}: {e}")
+                            self.stats["errors"].append(str(e))
+                    self._save_state()
+        finally:
+            stop.set()
+
 
 # ---------------------------------------------------------------------------
 # E2E Simulation Test
@@ -685,10 +924,11 @@ def simulate_e2e():
             logger.info(f"  ❌ FAIL: {name}")
 
     # Clean up previous test files
+    test_file = re.compile(r"(?:email|payment|linkedin|wa|task)_")
     for d in [PENDING_DIR, APPROVED_DIR, REJECTED_DIR]:
-        for f in d.iterdir():
-            if f.suffix == ".md" and f.stem.startswith(("email_", "payment_", "linkedin_", "wa_", "task_")):
-                f.unlink()
+        for entry in _md_entries(d):
+            if test_file.match(entry.name):
+                Path(entry.path).unlink(missing_ok=True)
 
     # ── Test 1: Create email action ──
     logger.info("\n📧 TEST 1: Create Email Action")
@@ -805,10 +1045,9 @@ def simulate_e2e():
     )
     # Manually set expiry to the past
     expired_action = HITLAction(expired_path)
-    expired_action.meta["expires"] = (datetime.now() - timedelta(hours=1)).isoformat()
-    expired_action._write()
+    expired_action._patch_frontmatter_line("expires", (datetime.now() - timedelta(hours=1)).isoformat())
 
-    check(HITLAction(expired_path).is_expired, "Expired action detected as expired")
+    check(expired_action.is_expired, "Expired action detected as expired")
 
     # Run watcher to process expiry
     cycle2 = watcher.scan_and_process()
@@ -832,6 +1071,7 @@ def main():
     parser = argparse.ArgumentParser(description="HITL Approval Watcher")
     parser.add_argument("--once", action="store_true", help="Single scan then exit")
     parser.add_argument("--simulate", action="store_true", help="Run E2E simulation test")
+    parser.add_argument("--poll", action="store_true", help="Poll instead of watching file events (NFS/CIFS mounts)")
     parser.add_argument("--interval", type=int, default=POLL_INTERVAL, help="Poll interval seconds")
     args = parser.parse_args()
 
@@ -856,7 +1096,7 @@ def main():
 
     else:
         watcher = HITLWatcher()
-        watcher.run_loop(interval=args.interval)
+        watcher.run_loop(interval=args.interval, poll=args.poll)
 
 
 if __name__ == "__main__":
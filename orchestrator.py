@@ -9,6 +9,7 @@ Usage:
     python orchestrator.py              # Run full orchestrator
     python orchestrator.py --simulate   # Run with simulated data (no Gmail/WhatsApp auth needed)
     python orchestrator.py --once       # Run a single cycle then exit
+    python orchestrator.py --poll       # Poll instead of watching file events (NFS/CIFS mounts)
 
 PM2:
     pm2 start ecosystem.config.js
@@ -20,16 +21,36 @@ import re
 import json
 import time
 import signal
+import tempfile
 import logging
 import argparse
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
 
 import yaml
 import schedule
 
+try:
+    from watchfiles import watch, Change
+except ImportError:
+    watch = None
+
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+try:
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    _content_hash = hashlib.blake2b
+
 # Error handling & audit logging
 from audit_logger import AuditLogger, ErrorCategory
 from retry_handler import ErrorHandler, retry, classify_error
@@ -46,9 +67,13 @@ DASHBOARD_FILE = VAULT_DIR / "Dashboard.md"
 HANDBOOK_FILE = VAULT_DIR / "Company_Handbook.md"
 LOG_FILE = VAULT_DIR / "orchestrator.log"
 STATE_FILE = VAULT_DIR / ".orchestrator_state.json"
+STATE_WAL_FILE = STATE_FILE.with_suffix(".wal")
 
 POLL_INTERVAL_SECONDS = 60
 CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+CLAUDE_CACHE_DIR = VAULT_DIR / ".claude_cache"
+CLAUDE_CACHE_TTL_SECONDS = 24 * 3600
+CLAUDE_CACHE_ENABLED = True  # turned off by --no-cache
 
 # Ensure directories exist
 for d in [NEEDS_ACTION_DIR, DONE_DIR, PLANS_DIR]:
@@ -83,13 +108,19 @@ audit = AuditLogger(component="orchestrator")
 # State Management
 # ---------------------------------------------------------------------------
 class OrchestratorState:
-    """Persistent state across restarts."""
+    """
+    Persistent state across restarts.
+
+    processed_files is appended to a WAL as files are handled; compact()
+    folds it into the JSON snapshot once per cycle.
+    """
 
     def __init__(self):
         self.processed_files: set = set()
         self.cycle_count: int = 0
         self.last_run: Optional[str] = None
         self.errors: list = []
+        self._wal = None
         self._load()
 
     def _load(self):
@@ -101,53 +132,111 @@ class OrchestratorState:
                 self.last_run = data.get("last_run")
             except Exception:
                 pass
+        # Replay names appended since the last snapshot; a torn last line is dropped
+        if STATE_WAL_FILE.exists():
+            try:
+                lines = STATE_WAL_FILE.read_text(encoding="utf-8").split("\n")
+                self.processed_files.update(name for name in lines[:-1] if name)
+            except Exception:
+                pass
 
-    def save(self):
+    def compact(self):
+        """Write the JSON snapshot, then truncate the WAL it now covers."""
         data = {
             "processed_files": list(self.processed_files),
             "cycle_count": self.cycle_count,
             "last_run": self.last_run,
         }
-        STATE_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fp:
+            fp.write(json.dumps(data, indent=2))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, STATE_FILE)
+
+        if self._wal is not None:
+            self._wal.seek(0)
+            self._wal.truncate()
+        elif STATE_WAL_FILE.exists():
+            STATE_WAL_FILE.write_text("", encoding="utf-8")
 
     def mark_processed(self, filename: str):
         self.processed_files.add(filename)
-        self.save()
+        if self._wal is None:
+            self._wal = open(STATE_WAL_FILE, "a", encoding="utf-8", buffering=1)
+        self._wal.write(f"{filename}\n")
 
 
 # ---------------------------------------------------------------------------
 # Company Handbook Rules Engine
 # ---------------------------------------------------------------------------
-def load_handbook_rules() -> list:
-    """Parse Company_Handbook.md for rules."""
-    rules = []
-    if HANDBOOK_FILE.exists():
-        content = HANDBOOK_FILE.read_text(encoding="utf-8")
-        for line in content.splitlines():
+@dataclass
+class RulesEngine:
+    """Handbook rules reduced to the checks apply_rules actually performs."""
+
+    rules: list = field(default_factory=list)
+    payment_threshold: Optional[float] = None
+    whatsapp_polite: bool = False
+
+    amount_re: ClassVar[re.Pattern] = re.compile(r"\$[\d,]+(?:\.\d{2})?")
+
+    @classmethod
+    def from_rules(cls, rules: list) -> "RulesEngine":
+        engine = cls(rules=rules)
+        for rule in rules:
+            rule_lower = rule.lower()
+            # Rule: Flag payments greater than $500
+            if "flag payments" in rule_lower and "$" in rule:
+                engine.payment_threshold = 500.0
+            # Rule: Always be polite on WhatsApp
+            if "polite" in rule_lower and "whatsapp" in rule_lower:
+                engine.whatsapp_polite = True
+        return engine
+
+
+# Handbook parse cache: (st_mtime_ns, st_size) fast path, content hash slow path
+_HANDBOOK_CACHE = {"sig": None, "digest": None, "engine": RulesEngine()}
+
+
+def load_handbook_rules() -> RulesEngine:
+    """Parse Company_Handbook.md into a RulesEngine (rebuilt only when its content changes)."""
+    cache = _HANDBOOK_CACHE
+    try:
+        with open(HANDBOOK_FILE, "rb") as fp:
+            # fstat the open handle so the signature matches the bytes we read
+            st = os.fstat(fp.fileno())
+            sig = (st.st_mtime_ns, st.st_size)
+            if sig == cache["sig"]:
+                return cache["engine"]
+            data = fp.read()
+    except FileNotFoundError:
+        return RulesEngine()
+
+    digest = _content_hash(data).hexdigest()
+    if digest != cache["digest"]:
+        rules = []
+        for line in data.decode("utf-8").splitlines():
             match = re.match(r"^\d+\.\s+(.+)$", line.strip())
             if match:
                 rules.append(match.group(1))
-    return rules
+        cache["engine"] = RulesEngine.from_rules(rules)
+        cache["digest"] = digest
+    cache["sig"] = sig
+    return cache["engine"]
 
 
-def apply_rules(text: str, rules: list) -> list:
+def apply_rules(text: str, engine: RulesEngine) -> list:
     """Check text against handbook rules, return violations/flags."""
     flags = []
-    text_lower = text.lower()
-
-    for rule in rules:
-        # Rule: Flag payments greater than $500
-        if "flag payments" in rule.lower() and "$" in rule:
-            amounts = re.findall(r"\$[\d,]+(?:\.\d{2})?", text)
-            rs_amounts = re.findall(r"Rs\.?\s*[\d,]+", text, re.IGNORECASE)
-            for amt in amounts:
-                val = float(amt.replace("$", "").replace(",", ""))
-                if val > 500:
-                    flags.append(f"FLAG: Payment ${val:,.0f} exceeds $500 threshold (Handbook Rule)")
-
-        # Rule: Always be polite on WhatsApp
-        if "polite" in rule.lower() and "whatsapp" in rule.lower():
-            flags.append("REMINDER: Maintain polite tone on WhatsApp (Handbook Rule)")
+
+    if engine.payment_threshold is not None:
+        for amt in engine.amount_re.findall(text):
+            val = float(amt.replace("$", "").replace(",", ""))
+            if val > engine.payment_threshold:
+                flags.append(f"FLAG: Payment ${val:,.0f} exceeds $500 threshold (Handbook Rule)")
+
+    if engine.whatsapp_polite:
+        flags.append("REMINDER: Maintain polite tone on WhatsApp (Handbook Rule)")
 
     return flags
 
@@ -155,7 +244,59 @@ def apply_rules(text: str, rules: list) -> list:
 # ---------------------------------------------------------------------------
 # Claude AI Trigger
 # ---------------------------------------------------------------------------
-def trigger_claude_analysis(new_files: list, handbook_rules: list) -> Optional[str]:
+def _claude_cache_path(prompt: str) -> Path:
+    """Cache file for a (model, prompt) pair; the prompt already embeds the handbook rules."""
+    key = _content_hash(f"{CLAUDE_MODEL}\n{prompt}".encode("utf-8")).hexdigest()
+    return CLAUDE_CACHE_DIR / f"{key[:64]}.md"
+
+
+def _read_claude_cache(path: Path) -> Optional[str]:
+    try:
+        if time.time() - path.stat().st_mtime > CLAUDE_CACHE_TTL_SECONDS:
+            return None
+        return path.read_text(encoding="utf-8")
+    except (OSError, ValueError) as e:
+        # Missing, unreadable or torn entries are just a miss
+        if not isinstance(e, FileNotFoundError):
+            logger.warning(f"Ignoring unreadable Claude cache entry {path.name}: {e}")
+        return None
+
+
+def _write_claude_cache(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            fp.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _prune_claude_cache(path.parent)
+
+
+def _prune_claude_cache(cache_dir: Path):
+    """Delete entries (and stray temp files) older than the cache TTL.
+
+    Nearly every prompt holds a different set of files, so most keys are
+    used once; without pruning the vault gains one file per cycle forever.
+    """
+    cutoff = time.time() - CLAUDE_CACHE_TTL_SECONDS
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith((".md", ".tmp")):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def trigger_claude_analysis(new_files: list, handbook_rules: RulesEngine) -> Optional[str]:
     """
     Send new files to Claude for analysis and action plan generation.
     Returns the generated plan text, or None on failure.
@@ -180,7 +321,8 @@ def trigger_claude_analysis(new_files: list, handbook_rules: list) -> Optional[s
         except Exception as e:
             file_contents.append(f"### File: {Path(fpath).name}\nError reading: {e}")
 
-    rules_text = "\n".join(f"- {r}" for r in handbook_rules) if handbook_rules else "No rules loaded."
+    rules = handbook_rules.rules
+    rules_text = "\n".join(f"- {r}" for r in rules) if rules else "No rules loaded."
 
     prompt = f"""You are an AI Employee managing an Obsidian vault. Analyze these new files from /Needs_Action and generate action items.
 
@@ -198,6 +340,14 @@ def trigger_claude_analysis(new_files: list, handbook_rules: list) -> Optional[s
 5. Group by category: Orders, WhatsApp Messages, Emails, Promotions.
 """
 
+    # Identical prompts (e.g. Ralph Wiggum retries) reuse the earlier response
+    cache_file = _claude_cache_path(prompt)
+    if CLAUDE_CACHE_ENABLED:
+        cached = _read_claude_cache(cache_file)
+        if cached is not None:
+            logger.info(f"Claude analysis served from cache ({cache_file.name[:12]})")
+            return cached
+
     try:
         client = anthropic.Anthropic(api_key=api_key)
         response = client.messages.create(
@@ -207,91 +357,124 @@ def trigger_claude_analysis(new_files: list, handbook_rules: list) -> Optional[s
         )
         plan_text = response.content[0].text
         logger.info("Claude analysis complete")
+        if CLAUDE_CACHE_ENABLED:
+            try:
+                _write_claude_cache(cache_file, plan_text)
+            except OSError as e:
+                logger.warning(f"Could not cache Claude response: {e}")
         return plan_text
     except Exception as e:
         logger.error(f"Claude API error: {e}")
         return _generate_local_plan(new_files, handbook_rules)
 
 
-def _generate_local_plan(new_files: list, handbook_rules: list) -> str:
+_URGENT_RE = re.compile(r"urgent|asap|emergency|critical|deadline", re.IGNORECASE)
+
+
+def _generate_local_plan(new_files: list, handbook_rules: RulesEngine) -> str:
     """Fallback: generate plan locally without Claude API."""
     lines = [f"## New Actions ({datetime.now().strftime('%Y-%m-%d %H:%M')})\n"]
 
-    for fpath in new_files:
-        try:
-            content = Path(fpath).read_text(encoding="utf-8")
-            fname = Path(fpath).name
-
-            # Parse YAML frontmatter
-            meta = {}
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    try:
-                        meta = yaml.safe_load(parts[1]) or {}
-                    except Exception:
-                        pass
-                    body = parts[2].strip()
-                else:
-                    body = content
-            else:
-                body = content
-
-            msg_type = meta.get("type", "unknown")
-            sender = meta.get("from", meta.get("sender", "Unknown"))
-            subject = meta.get("subject", meta.get("chat", fname))
-            priority = meta.get("priority", "normal")
-
-            # Apply handbook rules
-            flags = apply_rules(body, handbook_rules)
-            for fm_val in [str(meta.get("subject", "")), str(meta.get("from", ""))]:
-                flags.extend(apply_rules(fm_val, handbook_rules))
-            flags = list(set(flags))  # deduplicate
-
-            # Detect keywords
-            urgent_keywords = ["urgent", "asap", "emergency", "critical", "deadline"]
-            is_urgent = any(kw in body.lower() or kw in str(subject).lower() for kw in urgent_keywords)
-            if is_urgent:
-                priority = "urgent"
-
-            icon = {"urgent": "🔴", "high": "🟠", "normal": "🟢"}.get(priority, "⚪")
-
-            lines.append(f"### {icon} {subject}")
-            lines.append(f"**From:** {sender} | **Type:** {msg_type} | **Priority:** {priority}")
-
-            if flags:
-                for flag in flags:
-                    lines.append(f"- [x] **{flag}**")
-
-            lines.append(f"- [ ] Review and respond to {sender}")
-            if is_urgent:
-                lines.append("- [ ] **URGENT**: Handle immediately")
-            if "payment" in body.lower() or "invoice" in body.lower():
-                lines.append("- [ ] Process payment / review invoice")
-            lines.append(f"- [ ] Move `{fname}` to `/Done` when complete")
-            lines.append("")
+    # File reads release the GIL, so overlap them; map() keeps file order
+    if len(new_files) > 1:
+        workers = min(32, len(new_files))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            sections = list(ex.map(partial(_process_one_file, handbook_rules=handbook_rules), new_files))
+    else:
+        sections = [_process_one_file(fpath, handbook_rules) for fpath in new_files]
 
-        except Exception as e:
-            lines.append(f"### Error processing {Path(fpath).name}: {e}\n")
+    for section in sections:
+        lines.extend(section)
 
     return "\n".join(lines)
 
 
+def _process_one_file(fpath: str, handbook_rules: RulesEngine) -> list:
+    """Plan lines for a single /Needs_Action file (no shared state, thread-safe)."""
+    lines = []
+    try:
+        content = Path(fpath).read_text(encoding="utf-8")
+        fname = Path(fpath).name
+
+        # Parse YAML frontmatter (slice around the closing '---', no split copies)
+        meta = {}
+        body = content
+        if content.startswith("---"):
+            end = content.find("---", 3)
+            if end != -1:
+                try:
+                    meta = yaml.load(content[3:end], Loader=_YLoader) or {}
+                except Exception:
+                    pass
+                body = content[end + 3:].strip()
+
+        msg_type = meta.get("type", "unknown")
+        sender = meta.get("from", meta.get("sender", "Unknown"))
+        subject = meta.get("subject", meta.get("chat", fname))
+        priority = meta.get("priority", "normal")
+
+        # Apply handbook rules
+        flags = apply_rules(body, handbook_rules)
+        for fm_val in [str(meta.get("subject", "")), str(meta.get("from", ""))]:
+            flags.extend(apply_rules(fm_val, handbook_rules))
+        flags = list(dict.fromkeys(flags))  # deduplicate, keep first-seen order
+
+        # Detect keywords
+        is_urgent = bool(_URGENT_RE.search(body) or _URGENT_RE.search(str(subject)))
+        if is_urgent:
+            priority = "urgent"
+
+        icon = {"urgent": "🔴", "high": "🟠", "normal": "🟢"}.get(priority, "⚪")
+
+        lines.append(f"### {icon} {subject}")
+        lines.append(f"**From:** {sender} | **Type:** {msg_type} | **Priority:** {priority}")
+
+        if flags:
+            for flag in flags:
+                lines.append(f"- [x] **{flag}**")
+
+        lines.append(f"- [ ] Review and respond to {sender}")
+        if is_urgent:
+            lines.append("- [ ] **URGENT**: Handle immediately")
+        if "payment" in body.lower() or "invoice" in body.lower():
+            lines.append("- [ ] Process payment / review invoice")
+        lines.append(f"- [ ] Move `{fname}` to `/Done` when complete")
+        lines.append("")
+
+    except Exception as e:
+        lines.append(f"### Error processing {Path(fpath).name}: {e}\n")
+
+    return lines
+
+
 # ---------------------------------------------------------------------------
 # Plan.md & Dashboard.md Writers
 # ---------------------------------------------------------------------------
-def update_plan_md(new_plan_section: str, cycle: int):
-    """Append new actions to Plan.md."""
-    existing = ""
-    if PLAN_FILE.exists():
-        existing = PLAN_FILE.read_text(encoding="utf-8")
-
+def update_plan_md(new_plan_section: str, cycle: Optional[int]):
+    """Append new actions to Plan.md.
+
+    Only the tail of the file is inspected: trailing whitespace is trimmed in
+    place (Plan.md is hand-edited in Obsidian) and the new section appended,
+    so the result matches the old read-rstrip-rewrite without reading the
+    whole plan. Sections produced between cycles by file events have no
+    cycle number (`cycle=None`) and are headed as an event batch instead.
+    """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    separator = f"\n\n---\n\n## Orchestrator Cycle #{cycle} — {timestamp}\n\n"
-
-    updated = existing.rstrip() + separator + new_plan_section.strip() + "\n"
-    PLAN_FILE.write_text(updated, encoding="utf-8")
-    logger.info(f"Plan.md updated (cycle #{cycle})")
+    heading = f"Orchestrator Cycle #{cycle}" if cycle is not None else "Orchestrator Event Batch"
+    text = f"\n\n---\n\n## {heading} — {timestamp}\n\n" + new_plan_section.strip() + "\n"
+
+    with PLAN_FILE.open("a+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            kept = len(f.read(end - start).rstrip())
+            end = start + kept
+            if kept:
+                break
+        f.truncate(end)
+        f.write(text.replace("\n", os.linesep).encode("utf-8"))
+    logger.info(f"Plan.md updated ({heading})")
 
 
 def update_dashboard(stats: dict, cycle: int):
@@ -395,13 +578,18 @@ def run_whatsapp_watcher(simulate: bool = False) -> dict:
 # ---------------------------------------------------------------------------
 # Needs_Action Scanner
 # ---------------------------------------------------------------------------
-def scan_needs_action(state: OrchestratorState) -> list:
-    """Scan /Needs_Action for unprocessed .md files."""
+def snapshot_needs_action(state: OrchestratorState) -> tuple:
+    """One scandir pass over /Needs_Action: (unprocessed .md paths sorted by name, total .md count)."""
     new_files = []
-    for f in sorted(NEEDS_ACTION_DIR.iterdir()):
-        if f.suffix == ".md" and f.name not in state.processed_files:
-            new_files.append(str(f))
-    return new_files
+    total = 0
+    with os.scandir(NEEDS_ACTION_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                total += 1
+                if entry.name not in state.processed_files:
+                    new_files.append(entry.path)
+    new_files.sort()
+    return new_files, total
 
 
 # ---------------------------------------------------------------------------
@@ -435,6 +623,51 @@ def setup_scheduled_tasks():
 # ---------------------------------------------------------------------------
 # Main Orchestration Cycle
 # ---------------------------------------------------------------------------
+def _process_new_files(state: OrchestratorState, stats: dict, cycle: Optional[int] = None):
+    """
+    Steps 3-4: pick up unprocessed /Needs_Action files and plan for them.
+    `cycle` is the current cycle number, or None when triggered by a file event.
+    """
+    logger.info("[3/6] Scanning /Needs_Action...")
+    new_files, stats["total_files"] = snapshot_needs_action(state)
+    stats["new_files_processed"] = len(new_files)
+    logger.info(f"  Found {len(new_files)} new files, {stats['total_files']} total")
+
+    if new_files:
+        logger.info(f"[4/6] Processing {len(new_files)} new files...")
+        handbook_rules = load_handbook_rules()
+        plan_section = trigger_claude_analysis(new_files, handbook_rules)
+
+        if plan_section:
+            update_plan_md(plan_section, cycle)
+            stats["claude_status"] = "generated"
+        else:
+            stats["claude_status"] = "failed"
+
+        # Mark files as processed
+        for f in new_files:
+            state.mark_processed(Path(f).name)
+    else:
+        logger.info("[4/6] No new files — skipping analysis")
+
+
+def _run_hitl(stats: dict):
+    """Step 5: execute approved HITL actions and expire stale ones."""
+    try:
+        from hitl_watcher import HITLWatcher
+        hitl = HITLWatcher()
+        hitl_stats = hitl.scan_and_process()
+        stats["hitl_executed"] = hitl_stats.get("executed", 0)
+        stats["hitl_expired"] = hitl_stats.get("expired", 0)
+        stats["hitl_pending"] = hitl_stats.get("pending", 0)
+        if hitl_stats.get("errors"):
+            stats["errors"].extend(hitl_stats["errors"])
+        logger.info(f"  HITL: executed={stats['hitl_executed']}, expired={stats['hitl_expired']}, pending={stats['hitl_pending']}")
+    except Exception as e:
+        logger.error(f"HITL watcher error: {e}")
+        stats["errors"].append(f"HITL: {e}")
+
+
 def run_cycle(state: OrchestratorState, simulate: bool = False) -> dict:
     """Execute one full orchestrator cycle."""
     state.cycle_count += 1
@@ -477,46 +710,12 @@ def run_cycle(state: OrchestratorState, simulate: bool = False) -> dict:
     if wa_result.get("status") == "error":
         stats["errors"].append(f"WhatsApp: {'; '.join(wa_result.get('errors', []))}")
 
-    # Step 3: Scan /Needs_Action for unprocessed files
-    logger.info("[3/6] Scanning /Needs_Action...")
-    new_files = scan_needs_action(state)
-    stats["total_files"] = len(list(NEEDS_ACTION_DIR.glob("*.md")))
-    stats["new_files_processed"] = len(new_files)
-    logger.info(f"  Found {len(new_files)} new files, {stats['total_files']} total")
-
-    # Step 4: Trigger Claude / generate plan for new files
-    if new_files:
-        logger.info(f"[4/6] Processing {len(new_files)} new files...")
-        handbook_rules = load_handbook_rules()
-        plan_section = trigger_claude_analysis(new_files, handbook_rules)
-
-        if plan_section:
-            update_plan_md(plan_section, cycle)
-            stats["claude_status"] = "generated"
-        else:
-            stats["claude_status"] = "failed"
-
-        # Mark files as processed
-        for f in new_files:
-            state.mark_processed(Path(f).name)
-    else:
-        logger.info("[4/6] No new files — skipping analysis")
+    # Steps 3-4: Scan /Needs_Action and generate a plan for new files
+    _process_new_files(state, stats, state.cycle_count)
 
     # Step 5: HITL Watcher — process approved actions, expire stale
     logger.info("[5/6] Running HITL watcher...")
-    try:
-        from hitl_watcher import HITLWatcher
-        hitl = HITLWatcher()
-        hitl_stats = hitl.scan_and_process()
-        stats["hitl_executed"] = hitl_stats.get("executed", 0)
-        stats["hitl_expired"] = hitl_stats.get("expired", 0)
-        stats["hitl_pending"] = hitl_stats.get("pending", 0)
-        if hitl_stats.get("errors"):
-            stats["errors"].extend(hitl_stats["errors"])
-        logger.info(f"  HITL: executed={stats['hitl_executed']}, expired={stats['hitl_expired']}, pending={stats['hitl_pending']}")
-    except Exception as e:
-        logger.error(f"HITL watcher error: {e}")
-        stats["errors"].append(f"HITL: {e}")
+    _run_hitl(stats)
 
     # Step 6: Update Dashboard
     logger.info("[6/6] Updating Dashboard.md...")
@@ -532,7 +731,7 @@ def run_cycle(state: OrchestratorState, simulate: bool = False) -> dict:
     schedule.run_pending()
 
     # Save state
-    state.save()
+    state.compact()
 
     # Audit trail for cycle
     audit.audit(
@@ -559,18 +758,112 @@ def run_cycle(state: OrchestratorState, simulate: bool = False) -> dict:
 # Signal Handling (for PM2 graceful shutdown)
 # ---------------------------------------------------------------------------
 _shutdown = False
+_shutdown_event = threading.Event()
 
 
 def handle_shutdown(signum, frame):
     global _shutdown
     logger.info(f"Received signal {signum} — shutting down gracefully...")
     _shutdown = True
+    _shutdown_event.set()
 
 
 signal.signal(signal.SIGTERM, handle_shutdown)
 signal.signal(signal.SIGINT, handle_shutdown)
 
 
+# ---------------------------------------------------------------------------
+# Run Loops
+# ---------------------------------------------------------------------------
+def _guarded_cycle(state: OrchestratorState, simulate: bool, consecutive_clean: int) -> int:
+    """Run one full cycle, never raising; returns the updated clean-cycle streak."""
+    try:
+        stats = run_cycle(state, simulate=simulate)
+
+        if not stats["errors"]:
+            consecutive_clean += 1
+        else:
+            consecutive_clean = 0
+
+        if consecutive_clean >= 1 and simulate:
+            logger.info(f"Ralph Wiggum check: {consecutive_clean} clean cycle(s) — system stable")
+
+    except Exception as e:
+        logger.error(f"CYCLE CRASH: {e}", exc_info=True)
+        consecutive_clean = 0
+    return consecutive_clean
+
+
+def _poll_loop(state: OrchestratorState, args):
+    """Main loop (Ralph Wiggum iteration: keep going until clean)."""
+    consecutive_clean = 0
+    while not _shutdown:
+        consecutive_clean = _guarded_cycle(state, args.simulate, consecutive_clean)
+
+        if _shutdown:
+            break
+
+        logger.info(f"Sleeping {args.interval}s until next cycle...")
+        # Sleep in small increments for responsive shutdown
+        for _ in range(args.interval):
+            if _shutdown:
+                break
+            time.sleep(1)
+
+
+def _watch_loop(state: OrchestratorState, args):
+    """
+    React to new files in /Needs_Action and /Approved as soon as they land.
+    Watchers (Gmail, WhatsApp), HITL expiry, the dashboard and cron jobs are
+    time-based, so a housekeeping thread still runs the full cycle every
+    `args.interval` seconds.
+    """
+    lock = threading.Lock()
+    watch_dirs = [NEEDS_ACTION_DIR]
+    try:
+        from hitl_watcher import APPROVED_DIR as hitl_approved_dir
+        watch_dirs.append(hitl_approved_dir)
+    except Exception as e:
+        logger.warning(f"HITL folder not watched: {e}")
+        hitl_approved_dir = None
+
+    def housekeeping():
+        consecutive_clean = 0
+        while not _shutdown_event.is_set():
+            with lock:
+                consecutive_clean = _guarded_cycle(state, args.simulate, consecutive_clean)
+            logger.info(f"Next housekeeping cycle in {args.interval}s...")
+            if _shutdown_event.wait(args.interval):
+                break
+
+    keeper = threading.Thread(target=housekeeping, name="orchestrator-housekeeping", daemon=True)
+    keeper.start()
+    logger.info(f"Watching {', '.join(str(d) for d in watch_dirs)} for new files")
+
+    try:
+        for changes in watch(*watch_dirs, stop_event=_shutdown_event, rust_timeout=5000):
+            parents = {Path(p).parent.name for change, p in changes
+                       if change != Change.deleted and p.endswith(".md")}
+            if not parents:
+                continue
+            with lock:
+                try:
+                    stats = {"errors": []}
+                    if NEEDS_ACTION_DIR.name in parents:
+                        _process_new_files(state, stats)
+                    if hitl_approved_dir is not None and hitl_approved_dir.name in parents:
+                        _run_hitl(stats)
+                    state.compact()
+                    if stats["errors"]:
+                        logger.warning(f"Errors: {stats['errors']}")
+                except Exception as e:
+                    logger.error(f"Event handling error: {e}", exc_info=True)
+    finally:
+        # Let an in-flight housekeeping cycle finish its writes before exiting
+        _shutdown_event.set()
+        keeper.join()
+
+
 # ---------------------------------------------------------------------------
 # Entry Point
 # ---------------------------------------------------------------------------
@@ -578,9 +871,14 @@ def main():
     parser = argparse.ArgumentParser(description="AI Employee Orchestrator")
     parser.add_argument("--simulate", action="store_true", help="Use simulated data (no auth needed)")
     parser.add_argument("--once", action="store_true", help="Run a single cycle then exit")
+    parser.add_argument("--poll", action="store_true", help="Poll instead of watching file events (NFS/CIFS mounts)")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Claude, ignoring cached responses")
     parser.add_argument("--interval", type=int, default=POLL_INTERVAL_SECONDS, help="Poll interval in seconds")
     args = parser.parse_args()
 
+    global CLAUDE_CACHE_ENABLED
+    CLAUDE_CACHE_ENABLED = not args.no_cache
+
     logger.info("=" * 60)
     logger.info("AI EMPLOYEE ORCHESTRATOR STARTING")
     logger.info(f"  Vault: {VAULT_DIR}")
@@ -597,33 +895,12 @@ def main():
         print(json.dumps(stats, indent=2))
         return
 
-    # Main loop (Ralph Wiggum iteration: keep going until clean)
-    consecutive_clean = 0
-    while not _shutdown:
-        try:
-            stats = run_cycle(state, simulate=args.simulate)
-
-            if not stats["errors"]:
-                consecutive_clean += 1
-            else:
-                consecutive_clean = 0
-
-            if consecutive_clean >= 1 and args.simulate:
-                logger.info(f"Ralph Wiggum check: {consecutive_clean} clean cycle(s) — system stable")
-
-        except Exception as e:
-            logger.error(f"CYCLE CRASH: {e}", exc_info=True)
-            consecutive_clean = 0
-
-        if _shutdown:
-            break
-
-        logger.info(f"Sleeping {args.interval}s until next cycle...")
-        # Sleep in small increments for responsive shutdown
-        for _ in range(args.interval):
-            if _shutdown:
-                break
-            time.sleep(1)
+    if args.poll or watch is None:
+        if not args.poll:
+            logger.warning("watchfiles not installed — falling back to polling")
+        _poll_loop(state, args)
+    else:
+        _watch_loop(state, args)
 
     logger.info("Orchestrator shut down cleanly.")
 
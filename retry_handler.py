@@ -755,6 +755,9 @@ def run_tests():
             e4 = logger.logic_error("Invalid amount", data={"amount": -100})
             check(e4["category"] == ErrorCategory.LOGIC, "Logic category")
 
+            e5 = logger.log("WARNING", "Level outside LogLevel")
+            check(e5 is not None and e5["level"] == "WARNING", "Unknown level still written")
+
             logger.end_trace()
 
             # Verify JSONL file
@@ -762,7 +765,8 @@ def run_tests():
             check(len(log_files) == 1, "JSONL log file created")
             if log_files:
                 entries = AuditLogger.read_logs(log_files[0])
-                check(len(entries) >= 4, f"At least 4 entries written ({len(entries)})")
+                check(len(entries) >= 5, f"At least 5 entries written ({len(entries)})")
+                check(any(e["level"] == "WARNING" for e in entries), "Unknown level in JSONL file")
 
                 # Filter by category
                 transient_entries = AuditLogger.read_logs(